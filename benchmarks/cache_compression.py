@@ -0,0 +1,71 @@
+"""
+ToolOS SDK - Cache Compression Benchmark
+========================================
+
+Writes and reads representative payloads through CacheAPI without
+compression, with zlib and with lzma, and reports the stored size and
+the write/read throughput (MB/s of uncompressed data). The memory tier
+is disabled so every read decodes the stored entry.
+
+    python benchmarks/cache_compression.py [ROUNDS]      (default: 20)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import base64
+import json
+import random
+import tempfile
+import time
+from toolos.api import CacheAPI
+
+
+def payloads():
+    rng = random.Random(7)
+    words = ["einkaufen", "milch", "brot", "termin", "projekt", "notiz", "erledigt", "morgen", "heute"]
+    tasks = [{"id": i, "title": " ".join(rng.choices(words, k=4)), "done": rng.random() < 0.5,
+              "created": f"2024-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}"} for i in range(200)]
+    diary = {f"2024-01-{day:02d}": " ".join(rng.choices(words, k=300)) for day in range(1, 29)}
+    noise = base64.b64encode(rng.randbytes(256 * 1024)).decode()
+    return [
+        ("tasks json 26 KB", json.dumps(tasks, indent=4)),
+        ("diary json 60 KB", json.dumps(diary, indent=4)),
+        ("catalog 2.4 MB", json.dumps({f"key_{i}": f"Übersetzung {words[i % 9]} {i}" for i in range(60000)}, ensure_ascii=False)),
+        ("base64 340 KB", noise),
+    ]
+
+
+def run(cache, content, rounds):
+    size = len(content.encode('utf-8'))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        cache.WriteCacheFile("entry.json", content)
+    write = size * rounds / (time.perf_counter() - start) / 1e6
+    start = time.perf_counter()
+    for _ in range(rounds):
+        cache.ReadCacheFile("entry.json")
+    read = size * rounds / (time.perf_counter() - start) / 1e6
+    stored = os.path.getsize(cache.Path("entry.json"))
+    return stored, write, read
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{'payload':<20}{'codec':<7}{'stored KB':>11}{'ratio':>8}{'write MB/s':>12}{'read MB/s':>11}")
+    print("-" * 69)
+    with tempfile.TemporaryDirectory() as root:
+        cache = CacheAPI(os.path.join(root, "cache"))
+        cache.Memory.MAX_BYTES = 0
+        for name, content in payloads():
+            size = len(content.encode('utf-8'))
+            for codec in ("none", "zlib", "lzma"):
+                cache.COMPRESSION = codec if codec != "none" else "zlib"
+                cache.COMPRESS_THRESHOLD = 0 if codec == "none" else 1
+                stored, write, read = run(cache, content, rounds)
+                print(f"{name:<20}{codec:<7}{stored / 1024:>11.1f}{size / stored:>8.2f}{write:>12.1f}{read:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+ToolOS SDK - Cache Directory Layout Benchmark
+=============================================
+
+Creates, reads and stats N cache entries with the flat layout
+({cachepath}/{key}) and the sharded layout ({cachepath}/ab/cd/{key}).
+The memory tier is disabled so every operation hits the filesystem.
+
+    python benchmarks/cache_layout.py [N ...]      (default: 1000 100000)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import tempfile
+import time
+from toolos.api import CacheAPI
+
+
+def run(count, sharded):
+    with tempfile.TemporaryDirectory() as root:
+        cache = CacheAPI(os.path.join(root, "cache"))
+        cache.SHARDED = sharded
+        cache.Memory.MAX_BYTES = 0
+        keys = [f"entry_{i:07d}.json" for i in range(count)]
+        sample = random.Random(7).sample(keys, min(count, 5000))
+
+        start = time.perf_counter()
+        for key in keys:
+            cache.WriteCacheFile(key, "{}")
+        create = (time.perf_counter() - start) / count * 1e6
+
+        start = time.perf_counter()
+        for key in sample:
+            cache.ReadCacheFile(key)
+        read = (time.perf_counter() - start) / len(sample) * 1e6
+
+        start = time.perf_counter()
+        for key in sample:
+            os.stat(cache.Path(key))
+        stat = (time.perf_counter() - start) / len(sample) * 1e6
+
+        start = time.perf_counter()
+        listed = sum(1 for _ in os.scandir(cache.CACHEPATH))
+        listing = (time.perf_counter() - start) * 1e3
+    return create, read, stat, listing, listed
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [1000, 100000]
+    print(f"{'entries':>9} {'layout':<8}{'create µs':>11}{'read µs':>10}{'stat µs':>10}{'top-level list ms':>19}")
+    print("-" * 67)
+    for count in counts:
+        for sharded in (False, True):
+            create, read, stat, listing, listed = run(count, sharded)
+            layout = "sharded" if sharded else "flat"
+            print(f"{count:>9} {layout:<8}{create:>11.1f}{read:>10.1f}{stat:>10.1f}{listing:>13.2f} ({listed})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+ToolOS SDK - Multi-Process File Stress Test
+===========================================
+
+Starts several Python processes (like the Terminal mod does) that hammer
+the same cache, temp and log directories at once, then checks that
+nothing was torn or lost:
+
+  full writes  every read of a large cache entry is one complete payload
+  appends      every log/temp line is intact and none is missing
+  locking      a counter incremented under Cache.Lock() ends at the exact sum
+
+    python benchmarks/file_locking.py [PROCESSES] [ITERATIONS]   (default: 8 200)
+
+Exits with status 1 if any check fails.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import multiprocessing
+import re
+import tempfile
+import time
+from toolos.api import CacheAPI, TempAPI, LogAPI
+
+PAYLOAD = 256 * 1024
+LINE = re.compile(r"^(\d+):(\d+):(x{500})$")
+
+
+def payload(worker, iteration):
+    letter = "abcdefghijklmnopqrstuvwxyz"[(worker + iteration) % 26]
+    return f"{worker}:{iteration}:" + letter * PAYLOAD + "#END"
+
+
+def valid(content):
+    head, _, body = content.partition(":")
+    _, _, body = body.partition(":")
+    return content.endswith("#END") and len(body) == PAYLOAD + 4 and body.count(body[0]) == PAYLOAD
+
+
+def writer(root, worker, iterations):
+    cache = CacheAPI(os.path.join(root, "cache"))
+    temp = TempAPI(os.path.join(root, "temp"))
+    log = LogAPI(os.path.join(root, "log"))
+    for iteration in range(iterations):
+        cache.WriteCacheFile("shared.txt", payload(worker, iteration))
+        log.WriteLog("stress.log", f"{worker}:{iteration}:" + "x" * 500)
+        temp.AddContent("stress.txt", f"{worker}:{iteration}:" + "x" * 500)
+        with cache.Lock("counter"):
+            count = int(cache.ReadCacheFile("counter")) if cache.CacheExists("counter") else 0
+            cache.WriteCacheFile("counter", str(count + 1))
+
+
+def reader(root, stop, result):
+    cache = CacheAPI(os.path.join(root, "cache"))
+    cache.Memory.MAX_BYTES = 0
+    reads = torn = 0
+    while not stop.is_set():
+        try:
+            content = cache.ReadCacheFile("shared.txt")
+        except FileNotFoundError:
+            continue
+        reads += 1
+        if not valid(content):
+            torn += 1
+    result.put((reads, torn))
+
+
+def lines(path, processes, iterations):
+    seen = set()
+    broken = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip("\n")
+            match = LINE.match(line.split("] ", 1)[-1])
+            if match is None:
+                broken += 1
+            else:
+                seen.add((int(match.group(1)), int(match.group(2))))
+    return broken, processes * iterations - len(seen)
+
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    context = multiprocessing.get_context("spawn")  # fresh interpreters, like subprocess modules
+    with tempfile.TemporaryDirectory() as root:
+        stop = context.Event()
+        result = context.Queue()
+        watcher = context.Process(target=reader, args=(root, stop, result))
+        workers = [context.Process(target=writer, args=(root, worker, iterations)) for worker in range(processes)]
+        watcher.start()
+        start = time.perf_counter()
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join()
+        elapsed = time.perf_counter() - start
+        stop.set()
+        reads, torn = result.get()
+        watcher.join()
+
+        cache = CacheAPI(os.path.join(root, "cache"))
+        counter = int(cache.ReadCacheFile("counter"))
+        log_broken, log_missing = lines(os.path.join(root, "log", "stress.log"), processes, iterations)
+        temp_broken, temp_missing = lines(os.path.join(root, "temp", "stress.txt"), processes, iterations)
+        final = cache.ReadCacheFile("shared.txt")
+
+    checks = [
+        ("full writes", torn == 0 and valid(final), f"{reads} concurrent reads, {torn} torn"),
+        ("log appends", log_broken == 0 and log_missing == 0, f"{log_broken} broken, {log_missing} missing lines"),
+        ("temp appends", temp_broken == 0 and temp_missing == 0, f"{temp_broken} broken, {temp_missing} missing lines"),
+        ("locked counter", counter == processes * iterations, f"{counter} / {processes * iterations}"),
+    ]
+    print(f"{processes} processes x {iterations} iterations in {elapsed:.1f}s")
+    for name, ok, detail in checks:
+        print(f"  {'PASS' if ok else 'FAIL'}  {name:<15}{detail}")
+    return 0 if all(ok for _, ok, _ in checks) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+ToolOS SDK - Language Catalog Cache Benchmark
+=============================================
+
+Compares the cold path (json.load of data/lang/<lang>.json) with the warm
+path (one read of the compiled CatalogCache blob) for all shipped languages.
+
+    python benchmarks/language_catalog.py [rounds]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import time
+from toolos.api import CatalogCache
+
+
+LANGPATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "toolos", "data", "lang")
+
+
+def measure(function, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    languages = sorted(f[:-5] for f in os.listdir(LANGPATH) if f.endswith(".json"))
+
+    with tempfile.TemporaryDirectory() as cache_path:
+        cold = CatalogCache()            # no cache path -> always json.load
+        warm = CatalogCache(cache_path)
+
+        print(f"{'lang':<6}{'keys':>6}{'cold µs':>12}{'warm µs':>12}{'speedup':>10}")
+        print("-" * 46)
+        total_cold = total_warm = 0.0
+        for lang in languages:
+            source = os.path.join(LANGPATH, f"{lang}.json")
+            warm.Load(source)  # build the blob once
+            keys = len(cold.Load(source))
+            t_cold = measure(lambda: cold.Load(source), rounds)
+            t_warm = measure(lambda: warm.Load(source), rounds)
+            total_cold += t_cold
+            total_warm += t_warm
+            print(f"{lang:<6}{keys:>6}{t_cold:>12.1f}{t_warm:>12.1f}{t_cold / t_warm:>9.1f}x")
+        print("-" * 46)
+        print(f"{'all':<6}{'':>6}{total_cold:>12.1f}{total_warm:>12.1f}{total_cold / total_warm:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
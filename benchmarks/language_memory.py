@@ -0,0 +1,76 @@
+"""
+ToolOS SDK - Resident Catalog Memory Benchmark
+==============================================
+
+Measures the memory of keeping all shipped languages resident, once as one
+dict per language (default) and once as CompactCatalog (shared key table +
+value tuple per language), plus the Translate lookup cost of both.
+
+    python benchmarks/language_memory.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gc
+import json
+import time
+import tracemalloc
+from toolos.api import CompactCatalog
+
+
+LANGPATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "assets", "manager", "lang")
+
+
+def load_sources():
+    sources = {}
+    for name in sorted(os.listdir(LANGPATH)):
+        if name.endswith(".json"):
+            with open(os.path.join(LANGPATH, name), "rb") as f:
+                sources[name[:-5]] = f.read()
+    return sources
+
+
+def measure_memory(build):
+    build()  # warm-up: first calls allocate code/type caches that are not part of the catalogs
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    catalogs = build()
+    gc.collect()
+    return catalogs, tracemalloc.get_traced_memory()[0] - before
+
+
+def build_compact(sources):
+    table = {}  # one key table per run, like CompactCatalog.KEYS in a process
+    return {lang: CompactCatalog(json.loads(raw), table) for lang, raw in sources.items()}
+
+
+def measure_lookup(catalog, keys, rounds=200):
+    get = catalog.get
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for key in keys:
+            get(key, key)
+    return (time.perf_counter() - start) / (rounds * len(keys)) * 1e9
+
+
+def main():
+    sources = load_sources()
+
+    tracemalloc.start()
+    dicts, dict_bytes = measure_memory(lambda: {lang: json.loads(raw) for lang, raw in sources.items()})
+    compact, compact_bytes = measure_memory(lambda: build_compact(sources))
+    tracemalloc.stop()
+
+    keys = list(next(iter(dicts.values())))
+    print(f"languages: {len(sources)}, keys per language: {len(keys)}")
+    print(f"{'layout':<22}{'memory KiB':>12}{'lookup ns':>12}")
+    print("-" * 46)
+    print(f"{'dict per language':<22}{dict_bytes / 1024:>12.1f}{measure_lookup(dicts['en'], keys):>12.1f}")
+    print(f"{'CompactCatalog':<22}{compact_bytes / 1024:>12.1f}{measure_lookup(compact['en'], keys):>12.1f}")
+    print(f"memory saved: {100 - compact_bytes / dict_bytes * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
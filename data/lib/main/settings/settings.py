@@ -2,9 +2,11 @@ class SettingsManager:
     
     def __init__(self):
         import json as js
+        from toolos.api import SettingsWriter
         self.js = js
         self.IsRUNNING = True
         self.SETTINGSPATH = "data/assets/manager/settings.json"
+        self.Writer = SettingsWriter(self.SETTINGSPATH) # atomar + gebündelt (debounce)
         
     def LoadSettings(self):
         with open (self.SETTINGSPATH, "r", encoding="utf-8") as f:
@@ -23,11 +25,15 @@ class SettingsManager:
                 self.SETTINGS[v[0]] = value
                 self.SETTINGS["update"] = True
                 print("Settings aktualisiert:", self.SETTINGS)
-                self.js.dump(self.SETTINGS, open(self.SETTINGSPATH, "w", encoding="utf-8"), indent=4)
+                self.Writer.Write({v[0]: value, "update": True})  # nur die geänderten Keys
                 print(f"Setting '{v[0]}' auf '{value}' gesetzt.")
                 
                 return True
             
+    def SaveSettings(self):
+        self.Writer.Flush()
+        return True
+            
     def AskInput(self, text):
        eingabe = input(f"{text}: ")
        return eingabe
@@ -43,6 +49,7 @@ def main():
         eingabe = sm.AskInput("Eingabe (q zum beenden)> ")
         if eingabe.lower() == 'q': 
             sm.IsRUNNING = False
+            sm.SaveSettings()
             print("Beende Settings Manager...")
             break
         else:
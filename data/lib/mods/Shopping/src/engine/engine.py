@@ -2,7 +2,8 @@ import toolos.api as api
 
 class Engine:
     
-    def __init__(self, settings_path, sdk, package: dict):
+    def __init__(self, sdk, package: dict, settings_path=None):
+        # settings_path=None -> reuses settings, language catalogs and storage of the running ToolOS app
         self.api = api.ToolAPI(settings_path=settings_path, **sdk)
     
     
@@ -40,11 +40,11 @@ class FileManagementDemo(ToolAPI):
             }
         }
         
-        self.Cache.WriteCacheFile("user_session.json", json.dumps(cache_data, indent=2))
+        self.Cache.Set("user_session.json", cache_data)  # serialized as json
         print("✅ Cache file written: user_session.json")
         
-        # Read cache data
-        cached_content = self.Cache.ReadCacheFile("user_session.json")
+        # Read cache data (decoded object, served from memory while unchanged)
+        cached_content = self.Cache.Get("user_session.json")
         print("📖 Cache content loaded successfully")
         
         # Add content to cache
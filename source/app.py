@@ -14,18 +14,22 @@ class App(engine.Engine):
         self.BuildMainMenu()  # Menu erstellen
         self.END = False
         self.task = None
+        self.Settings.Subscribe(self.OnSettingsChanged)
+        self.Settings.StartWatcher()
+        self.Temp.StartPurge()  # Reste früherer Läufe (auch Unterordner) im Hintergrund entfernen
     
     def BuildMainMenu(self):
         """Erstellt das Hauptmenü mit aktuellen Übersetzungen"""
+        settings, book, packages = self.Language.TranslateMany(("settings", "book", "package_management"))
         mainmenu = [{"build": {
-                    "mesh": self.Language.Translate("settings"),
+                    "mesh": settings,
                     "source": "settings.py",
                     "action": "main",
                     "path": "settings",
                     "method": "main" 
                 }}, {
                     "build": {
-                    "mesh": self.Language.Translate("book"),
+                    "mesh": book,
                     "source": "book.py",
                     "action": "start",
                     "path": "book",
@@ -34,7 +38,7 @@ class App(engine.Engine):
                     },
                 {
                     "build": {
-                    "mesh": self.Language.Translate("package_management"),
+                    "mesh": packages,
                     "source": "package.py",
                     "action": "start",
                     "path": "packages",
@@ -47,6 +51,14 @@ class App(engine.Engine):
         # Mods laden wenn aktiviert
         if self.menu.mods_enabled:
             self.menu.LoadModMenus(self.loader)
+
+    def OnSettingsChanged(self, settings):
+        """Wird nur bei echter Änderung der settings.json ausgelöst"""
+        self.menu.Update()
+        self.Language.Reload()
+        self.BuildMainMenu()
+        self.menu.ReadMenuData()
+        print(self.Language.Translate("setting_changed"))
     
     def run(self):
         print(self.Language.Translate("app_is_running"))
@@ -64,14 +76,11 @@ class App(engine.Engine):
                 self.menu.ShowMenu()
                 
             self.StateMachine.SetState(self.StateMachine.MAINMENU)
-            self.Temp.RemoveTempFile()
+            if not self.Temp.IsScheduled():
+                self.Temp.Cleanup()  # nur von TempAPI erstellte Dateien, ohne neue Dateien nur ein stat
 
             if self.Settings.CheckIfUpdate():
-                self.Settings.Update()
-                self.Language.Reload()
-                self.BuildMainMenu()
-                self.menu.ReadMenuData()
-                print(self.Language.Translate("setting_changed"))
+                self.Settings.Update()  # löst OnSettingsChanged aus
 
             if self.StateMachine.IsState(self.StateMachine.MAINMENU):
                 self.menu.ClearConsole()
@@ -82,6 +91,9 @@ class App(engine.Engine):
             if self.StateMachine.IsState(self.StateMachine.EXIT):
                 print(self.Language.Translate("exiting_app"))
                 self.isRunning = False
+                self.Settings.StopWatcher()
+                self.Temp.StopCleanup()
+                self.Temp.Cleanup()
                 break
 
             self.doTasks()
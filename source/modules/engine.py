@@ -6,4 +6,6 @@ class Engine(engine.Api):
         import modules.menu as menu
         import modules.loader as loader
         self.menu = menu.MenuAsset(self)
-        self.loader = loader.ModLoader(self.Settings)
\ No newline at end of file
+        self.loader = loader.ModLoader(self.Settings)
+        # "prefetch" der Mods im Hintergrund vorladen (Cache-Einträge in den Memory-Tier, {"file": ...} nur in den Page-Cache)
+        self.prefetch = self.Cache.Prefetch(self.loader.PREFETCH) if self.Settings.MODS_ENABLED else None
\ No newline at end of file
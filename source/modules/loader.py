@@ -22,6 +22,7 @@ class ModLoader:
             
         self.AVAILABLE_MODS = self.CheckMods()
         self.MODDED = []
+        self.PREFETCH = []  # Cache-Einträge/Dateien aus "prefetch" der package.json, für den Start-Warm-up
         self.ReadMods()
         
         
@@ -47,9 +48,19 @@ class ModLoader:
                                             "action": z,
                                             "path": w,
                                         })
+                                        self.ReadPrefetch(path, data.get("prefetch", []))  # erst nach der Prüfung des Builds
                                 
                                 
         
+    def ReadPrefetch(self, path, entries):
+        """Liest die "prefetch"-Liste einer package.json, z.B. ["preferences", {"file": "lang/de.json"}].
+        Namen sind Cache-Einträge (Memory-Tier, nur sinnvoll wenn der Mod über app.Cache liest),
+        {"file": ...} ist relativ zum Mod-Ordner und wärmt nur den Page-Cache des Systems."""
+        for entry in entries:
+            if isinstance(entry, str):
+                entry = {"cache": entry}
+            if isinstance(entry, dict):
+                self.PREFETCH.append({**entry, "base": path})
         
     def CheckMods(self):
         try:
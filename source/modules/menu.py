@@ -73,14 +73,15 @@ class MenuAsset:
             return None
         
     def Update(self):
-        
-        self.HEADER = self.api.Settings.Global("header") if self.api.Settings.Global("header") else None
-        self.ERRORS = self.api.Settings.Global("errors") if self.api.Settings.Global("errors") else None
-        self.mods_enabled = self.api.Settings.Global("mods_enabled") if self.api.Settings.Global("mods_enabled") else False
-        self.INPUTNAME = self.api.Settings.Global("inputname") if self.api.Settings.Global("inputname") else None
-        self.VERSION = self.api.Settings.Global("version") if self.api.Settings.Global("version") else None
-        self.LANGUAGE = self.api.Settings.Global("language") if self.api.Settings.Global("language") else None
-        self.TEMPPATH = self.api.Settings.Global("temppath") if self.api.Settings.Global("temppath") else None
+        settings = self.api.Settings.Snapshot  # eine konsistente Version für alle Werte
+        self.SETTINGS_REVISION = settings.REVISION
+        self.HEADER = settings.HEADER
+        self.ERRORS = settings.ERRORS
+        self.mods_enabled = settings.MODS_ENABLED
+        self.INPUTNAME = settings.INPUTNAME
+        self.VERSION = settings.VERSION
+        self.LANGUAGE = settings.LANGUAGE
+        self.TEMPPATH = settings.TEMPPATH
         
         
     def startMenu(self, selection):
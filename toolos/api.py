@@ -4,35 +4,29 @@ class SettingsAPI:
 
     def __init__(self, app):
         self.app = app
-        try:
-            self.SETTINGSPATH = self.app.SDK.SDK_SETTINGS
-            self.SETTINGS = self.LoadSettings()
-            self.VERSION = self.SETTINGS.get("version") if self.SETTINGS.get("version") else None
-            self.LANGUAGE = self.SETTINGS.get("language") if self.SETTINGS.get("language") else None
-            self.PACKAGEPATH = self.SETTINGS.get("packagepath") if self.SETTINGS.get("packagepath") else None
-            self.CACHEPATH = self.SETTINGS.get("cachepath") if self.SETTINGS.get("cachepath") else None
-            self.TEMPPATH = self.SETTINGS.get("temppath") if self.SETTINGS.get("temppath") else None
-            self.LOGPATH = self.SETTINGS.get("logpath") if self.SETTINGS.get("logpath") else None
-            self.APIPATH = self.SETTINGS.get("apipath") if self.SETTINGS.get("apipath") else None
-            self.LANGUAGEPATH = self.SETTINGS.get("languagepath") if self.SETTINGS.get("languagepath") else None
-            self.MODPATH = self.SETTINGS.get("modpath") if self.SETTINGS.get("modpath") else None
-            self.MODS_ENABLED = self.SETTINGS.get("mods_enabled") if self.SETTINGS.get ("mods_enabled") else False
-        except Exception:
-            import os
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            settings_path = os.path.join(current_dir, self.app.SDK.SDK_SETTINGS)
-            self.SETTINGSPATH = settings_path
-            self.SETTINGS = self.LoadSettings()
-            self.VERSION = self.SETTINGS.get("version") if self.SETTINGS.get("version") else None
-            self.LANGUAGE = self.SETTINGS.get("language") if self.SETTINGS.get("language") else None
-            self.PACKAGEPATH = self.SETTINGS.get("packagepath") if self.SETTINGS.get("packagepath") else None
-            self.CACHEPATH = self.SETTINGS.get("cachepath") if self.SETTINGS.get("cachepath") else None
-            self.TEMPPATH = self.SETTINGS.get("temppath") if self.SETTINGS.get("temppath") else None
-            self.LOGPATH = self.SETTINGS.get("logpath") if self.SETTINGS.get("logpath") else None
-            self.APIPATH = self.SETTINGS.get("apipath") if self.SETTINGS.get("apipath") else None
-            self.LANGUAGEPATH = self.SETTINGS.get("languagepath") if self.SETTINGS.get("languagepath") else None
-            self.MODPATH = self.SETTINGS.get("modpath") if self.SETTINGS.get("modpath") else None
-            self.MODS_ENABLED = self.SETTINGS.get("mods_enabled") if self.SETTINGS.get ("mods_enabled") else False          
+        self.SHARED = False  # True while SETTINGS is the dict of the process-wide SharedContext
+        context = SharedContext.Get(self.app.SDK.SDK_SETTINGS) if self.app.SDK.SDK_Shared else None
+        if context is not None:
+            # another Api/ToolAPI already loaded this file: reuse dict and snapshot (copy-on-write in Set)
+            self.SETTINGSPATH = context["path"]
+            self.SETTINGS = context["settings"]
+            self.SHARED = True
+            self.ApplySnapshot(context["snapshot"])
+        else:
+            try:
+                self.SETTINGSPATH = self.app.SDK.SDK_SETTINGS
+                self.SETTINGS = self.LoadSettings()
+            except Exception:
+                import os
+                current_dir = os.path.dirname(os.path.abspath(__file__))
+                settings_path = os.path.join(current_dir, self.app.SDK.SDK_SETTINGS)
+                self.SETTINGSPATH = settings_path
+                self.SETTINGS = self.LoadSettings()
+            self.ApplySnapshot()
+            self.Publish()
+        self.Watcher = SettingsWatcher(self.SETTINGSPATH)
+        self.Writer = SettingsWriter(self.SETTINGSPATH, debounce=self.Snapshot.SETTINGS_DEBOUNCE)
+        self.TRANSACTION = None
 
     def LoadSettings(self):
         import json
@@ -41,31 +35,393 @@ class SettingsAPI:
         
     def Global(self, key):
         return self.SETTINGS.get(key)
+
+    def ApplySnapshot(self, snapshot=None):
+        """Compiles SETTINGS into one immutable, typed Snapshot and mirrors its fields as attributes"""
+        if snapshot is None:
+            snapshot = SettingsSnapshot.Build(self.SETTINGS)
+        for attribute in snapshot.FIELDS:
+            setattr(self, attribute, getattr(snapshot, attribute))
+        self.Snapshot = snapshot  # swapped last, readers see either the old or the new version
+
+    def Publish(self):
+        """Makes the loaded settings the process-wide shared version for later Api/ToolAPI instances"""
+        if self.app.SDK.SDK_Shared:
+            SharedContext.Register(self.SETTINGSPATH, self.SETTINGS, self.Snapshot)
+            self.SHARED = True
+    
+    def Set(self, key, value):
+        """Sets a key and persists it. Rapid calls are coalesced into one write (debounce window).
+        Snapshot and attributes follow at once (in a transaction: at commit)."""
+        if self.SHARED:
+            self.SETTINGS = dict(self.SETTINGS)
+            self.SHARED = False
+        self.SETTINGS[key] = value
+        if self.TRANSACTION is None:
+            self.ApplySnapshot()
+            self.Publish()
+            self.Writer.Write({key: value})
+
+    def Transaction(self):
+        """with settings.Transaction(): ... -> all Set() calls are written once at commit, rolled back on error"""
+        return SettingsTransaction(self)
+
+    def Flush(self):
+        """Writes pending debounced changes immediately"""
+        self.Writer.Flush()
     
     def SetUpdate(self):
-        self.SETTINGS["update"] = True
-        import json
-        with open(self.SETTINGSPATH, 'w', encoding='utf-8') as f:
-            json.dump(self.SETTINGS, f, indent=4)
+        self.Set("update", True)
             
     def CheckIfUpdate(self):
-        return self.SETTINGS.get("update", False)
+        """Returns True if the settings file really changed since the last (Re)Load"""
+        return self.Watcher.Changed()
     
+    def Subscribe(self, callback):
+        """Registers callback(settings) which is fired by Update() after a real file change"""
+        self.Watcher.Subscribe(callback)
+
+    def Unsubscribe(self, callback):
+        self.Watcher.Unsubscribe(callback)
+
+    def StartWatcher(self, interval=1.0):
+        """Moves change detection to a background thread (inotify on Linux, stat-polling otherwise)"""
+        self.Watcher.Start(interval)
+
+    def StopWatcher(self):
+        self.Watcher.Stop()
     
     def Update(self):
         import json
+        fingerprint = self.Watcher.Fingerprint()
         with open(self.SETTINGSPATH, 'r', encoding='utf-8') as f:
             self.SETTINGS = json.load(f)
-        self.VERSION = self.SETTINGS.get("version") if self.SETTINGS.get("version") else None
-        self.LANGUAGE = self.SETTINGS.get("language") if self.SETTINGS.get("language") else None
-        self.PACKAGEPATH = self.SETTINGS.get("packagepath") if self.SETTINGS.get("packagepath") else None
-        self.CACHEPATH = self.SETTINGS.get("cachepath") if self.SETTINGS.get("cachepath") else None
-        self.TEMPPATH = self.SETTINGS.get("temppath") if self.SETTINGS.get("temppath") else None
-        self.LOGPATH = self.SETTINGS.get("logpath") if self.SETTINGS.get("logpath") else None
-        self.APIPATH = self.SETTINGS.get("apipath") if self.SETTINGS.get("apipath") else None
-        self.LANGUAGEPATH = self.SETTINGS.get("languagepath") if self.SETTINGS.get("languagepath") else None
-        self.MODPATH = self.SETTINGS.get("modpath") if self.SETTINGS.get("modpath") else None
-        self.MODS_ENABLED = self.SETTINGS.get("mods_enabled") if self.SETTINGS.get ("mods_enabled") else False
+        self.ApplySnapshot()
+        self.Publish()
+        if self.Watcher.Acknowledge(fingerprint):
+            self.Watcher.Notify(self)
+
+class SettingsTransaction:
+
+    def __init__(self, settings):
+        self.Settings = settings
+        self.backup = None
+        self.outermost = False
+
+    def __enter__(self):
+        self.outermost = self.Settings.TRANSACTION is None
+        if self.outermost:
+            if self.Settings.SHARED:
+                self.Settings.SETTINGS = dict(self.Settings.SETTINGS)
+                self.Settings.SHARED = False
+            self.backup = dict(self.Settings.SETTINGS)
+            self.Settings.TRANSACTION = self
+        return self.Settings
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.outermost:
+            return False
+        self.Settings.TRANSACTION = None
+        if exc_type is not None:
+            self.Settings.SETTINGS = self.backup
+            return False
+        changes = {key: value for key, value in self.Settings.SETTINGS.items() if key not in self.backup or self.backup[key] != value}
+        if changes:
+            self.Settings.ApplySnapshot()
+            self.Settings.Publish()
+            self.Settings.Writer.Write(changes, immediate=True)
+        return False
+
+    #? ################  SETTINGS SNAPSHOT #####################
+
+class SettingsSnapshot:
+    """Immutable, typed view of settings.json. Build() compiles a __slots__ class from SCHEMA once."""
+
+    # (attribute, settings key, type, default)
+    SCHEMA = (
+        ("VERSION", "version", str, None),
+        ("LANGUAGE", "language", str, None),
+        ("PACKAGEPATH", "packagepath", str, None),
+        ("CACHEPATH", "cachepath", str, None),
+        ("TEMPPATH", "temppath", str, None),
+        ("LOGPATH", "logpath", str, None),
+        ("APIPATH", "apipath", str, None),
+        ("LANGUAGEPATH", "languagepath", str, None),
+        ("MODPATH", "modpath", str, None),
+        ("MODS_ENABLED", "mods_enabled", bool, False),
+        ("HEADER", "header", str, None),
+        ("ERRORS", "errors", tuple, None),
+        ("INPUTNAME", "inputname", str, None),
+        ("SETTINGS_DEBOUNCE", "settings_debounce", float, 0.2),
+        ("LANGUAGE_CACHE_SIZE", "language_cache_size", int, 8),
+        ("COMPACT_CATALOGS", "compact_catalogs", bool, False),
+        ("CACHE_MEMORY_BYTES", "cache_memory_bytes", int, 4 * 1024 * 1024),
+        ("CACHE_TTL", "cache_ttl", float, 0.0),
+        ("CACHE_SERIALIZER", "cache_serializer", str, "json"),
+        ("CACHE_SHARDED", "cache_sharded", bool, False),
+        ("CACHE_MAX_BYTES", "cache_max_bytes", int, 0),
+        ("CACHE_MAX_ENTRIES", "cache_max_entries", int, 0),
+        ("CACHE_MAX_AGE", "cache_max_age", float, 0.0),
+        ("CACHE_SWEEP_INTERVAL", "cache_sweep_interval", float, 60.0),
+        ("CACHE_PINNED", "cache_pinned", tuple, ("diary.json", "tasks.json")),
+        ("CACHE_FLAT", "cache_flat", tuple, ("diary.json", "tasks.json")),
+        ("CACHE_BACKEND", "cache_backend", str, "files"),
+        ("CACHE_DATABASE", "cache_database", str, "cache.sqlite3"),
+        ("CACHE_STATS_INTERVAL", "cache_stats_interval", float, 0.0),
+        ("CACHE_COMPRESSION", "cache_compression", str, "zlib"),
+        ("CACHE_COMPRESS_THRESHOLD", "cache_compress_threshold", int, 0),
+        ("TEMP_CLEANUP_INTERVAL", "temp_cleanup_interval", float, 0.0),
+        ("TEMP_SPOOL_SIZE", "temp_spool_size", int, 0),
+        ("TEMP_MAX_AGE", "temp_max_age", float, 0.0),
+    )
+    FIELDS = ()
+    COMPILED = None
+    REVISIONS = 0
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"SettingsSnapshot is immutable, use Settings.Set('{name.lower()}', ...)")
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"SettingsSnapshot(REVISION={self.REVISION}, {fields})"
+
+    @classmethod
+    def Compile(cls):
+        if cls.COMPILED is None:
+            slots = tuple(attribute for attribute, _, _, _ in cls.SCHEMA)
+            cls.COMPILED = type("SettingsSnapshot", (cls,), {"__slots__": slots + ("REVISION",), "FIELDS": slots})
+        return cls.COMPILED
+
+    @classmethod
+    def Build(cls, settings):
+        snapshot = object.__new__(cls.Compile())
+        for attribute, key, kind, default in cls.SCHEMA:
+            object.__setattr__(snapshot, attribute, cls.Convert(settings.get(key), kind, default))
+        SettingsSnapshot.REVISIONS += 1
+        object.__setattr__(snapshot, "REVISION", SettingsSnapshot.REVISIONS)
+        return snapshot
+
+    @staticmethod
+    def Convert(value, kind, default):
+        if value is None:
+            return default
+        if kind is bool:
+            if isinstance(value, str):
+                return value.strip().lower() in ("1", "true", "yes", "on", "ja")
+            return bool(value)
+        if kind in (int, float):
+            try:
+                return kind(value)
+            except (TypeError, ValueError):
+                return default
+        if not value:  # "" and [] fall back like the former `x if x else None`
+            return default
+        if kind is tuple:
+            return tuple(value) if isinstance(value, (list, tuple)) else (value,)
+        return value if isinstance(value, kind) else kind(value)
+
+    #? ################  SETTINGS WRITER #####################
+
+class SettingsWriter:
+    """Persists settings atomically (temp file + fsync + rename) and coalesces bursts of writes.
+    Only changed keys are written: under a FileLock the file is re-read and they are merged in,
+    so the app, mods with their own copy and other processes do not overwrite each other's keys."""
+
+    def __init__(self, path, debounce=0.2, indent=4):
+        import threading
+        self.PATH = path
+        self.DEBOUNCE = debounce
+        self.INDENT = indent
+        self.lock = threading.Lock()
+        self.pending = None
+        self.timer = None
+        self.registered = False
+
+    def Write(self, changes, immediate=False):
+        """Schedules a write of the changed keys. Calls within the debounce window collapse into one disk write."""
+        with self.lock:
+            self.pending = {**(self.pending or {}), **changes}
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if immediate or not self.DEBOUNCE:
+                data, self.pending = self.pending, None
+            else:
+                self._Schedule()
+                return
+        self._Dump(data)
+
+    def Flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            data, self.pending = self.pending, None
+        if data is not None:
+            self._Dump(data)
+
+    def _Schedule(self):
+        import threading
+        if not self.registered:
+            import atexit
+            atexit.register(self.Flush)
+            self.registered = True
+        self.timer = threading.Timer(self.DEBOUNCE, self.Flush)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def _Dump(self, changes):
+        import json
+        with FileLock(self.PATH):
+            try:
+                with open(self.PATH, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                data = {}
+            data.update(changes)
+            AtomicFile.Write(self.PATH, json.dumps(data, indent=self.INDENT), durable=True)
+
+    #? ################  SETTINGS WATCHER #####################
+
+class SettingsWatcher:
+    """Detects real changes of the settings file by (inode, size, mtime) fingerprint.
+
+    Without a running thread Changed() costs one os.stat(). After Start() a background
+    thread (inotify on Linux, stat-polling elsewhere) raises a flag and Changed() does no I/O at all.
+    """
+
+    # inotify(7) constants
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_CLOEXEC = 0o2000000
+
+    def __init__(self, path):
+        import threading
+        self.PATH = path
+        self.SUBSCRIBERS = []
+        self.fingerprint = self.Fingerprint()
+        self.pending = threading.Event()
+        self.stopping = threading.Event()
+        self.thread = None
+        self.INOTIFY = False
+
+    def Fingerprint(self):
+        import os
+        try:
+            st = os.stat(self.PATH)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def Subscribe(self, callback):
+        if callback not in self.SUBSCRIBERS:
+            self.SUBSCRIBERS.append(callback)
+
+    def Unsubscribe(self, callback):
+        if callback in self.SUBSCRIBERS:
+            self.SUBSCRIBERS.remove(callback)
+
+    def Changed(self):
+        """True if the file differs from the last acknowledged fingerprint"""
+        if self.IsRunning():
+            return self.pending.is_set()
+        return self.Fingerprint() != self.fingerprint
+
+    def Acknowledge(self, fingerprint=None):
+        """Marks the current file state as seen. Returns True if it was a real change."""
+        if fingerprint is None:
+            fingerprint = self.Fingerprint()
+        self.pending.clear()
+        changed = fingerprint != self.fingerprint
+        self.fingerprint = fingerprint
+        if self.IsRunning():
+            # a write that raced with the reload must not be lost
+            self._Check()
+        return changed
+
+    def Notify(self, settings):
+        for callback in list(self.SUBSCRIBERS):
+            callback(settings)
+
+    def IsRunning(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def Start(self, interval=1.0):
+        import threading
+        if self.IsRunning():
+            return
+        self.stopping.clear()
+        fd = self._InotifyOpen()
+        self.INOTIFY = fd is not None
+        if self.INOTIFY:
+            self.thread = threading.Thread(target=self._InotifyLoop, args=(fd, interval), name="SettingsWatcher", daemon=True)
+        else:
+            self.thread = threading.Thread(target=self._PollLoop, args=(interval,), name="SettingsWatcher", daemon=True)
+        self.thread.start()
+
+    def Stop(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+        self.thread = None
+
+    def _Check(self):
+        if self.Fingerprint() != self.fingerprint:
+            self.pending.set()
+
+    def _PollLoop(self, interval):
+        while not self.stopping.wait(interval):
+            self._Check()
+
+    def _InotifyOpen(self):
+        import sys
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            import ctypes
+            import ctypes.util
+            import os
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(self.IN_CLOEXEC)
+            if fd < 0:
+                return None
+            # watching the directory also catches editors that replace the file via rename
+            directory = os.path.dirname(os.path.abspath(self.PATH))
+            mask = self.IN_MODIFY | self.IN_ATTRIB | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE | self.IN_DELETE
+            if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    def _InotifyLoop(self, fd, interval):
+        import os
+        import select
+        import struct
+        name = os.fsencode(os.path.basename(self.PATH))
+        header = struct.calcsize("iIII")
+        try:
+            while not self.stopping.is_set():
+                ready, _, _ = select.select([fd], [], [], interval)
+                if not ready:
+                    continue
+                buffer = os.read(fd, 4096)
+                offset = 0
+                while offset + header <= len(buffer):
+                    _, _, _, length = struct.unpack_from("iIII", buffer, offset)
+                    event_name = buffer[offset + header:offset + header + length].rstrip(b"\0")
+                    offset += header + length
+                    if event_name == name:
+                        self._Check()
+        finally:
+            os.close(fd)
 
     #? ################  StateMachine API #####################
     
@@ -99,79 +455,1819 @@ class StateMachineAPI:
 
 class CacheAPI:
     
-    def __init__(self, cache_path):
+    def __init__(self, cache_path, settings=None):
+        import os
+        import threading
         self.CACHEPATH = cache_path
+        self.Settings = settings
+        snapshot = getattr(settings, "Snapshot", None)
+        # in-process tier in front of the files, a hot key costs one stat (fingerprint check) instead of open/read/decode
+        self.Memory = CacheMemory(
+            max_bytes=snapshot.CACHE_MEMORY_BYTES if snapshot else 4 * 1024 * 1024,
+            ttl=snapshot.CACHE_TTL if snapshot else 0,
+        )
+        self.SERIALIZERS = {serializer.NAME: serializer for serializer in (JsonSerializer(), PickleSerializer(), MarshalSerializer())}
+        self.SERIALIZER = snapshot.CACHE_SERIALIZER if snapshot else "json"
+        self.SHARDED = snapshot.CACHE_SHARDED if snapshot else False  # hash-prefixed two-level subdirectories
+        self.SHARDS = set()  # shard directories known to exist
+        # keys that stay at {cachepath}/{key} in the sharded layout (opened by path by mods), fixed with the layout
+        self.FLAT = frozenset(snapshot.CACHE_FLAT if snapshot else ("diary.json", "tasks.json"))
+        self.COMPRESSION = snapshot.CACHE_COMPRESSION if snapshot else "zlib"
+        self.COMPRESS_THRESHOLD = snapshot.CACHE_COMPRESS_THRESHOLD if snapshot else 0  # bytes, 0 = store uncompressed
+        self.lock = threading.Lock()
+        self.INFLIGHT = {}  # memoize key -> pending computation, so concurrent callers wait for one result
+        self.Sweeper = CacheSweeper(
+            self,
+            max_bytes=snapshot.CACHE_MAX_BYTES if snapshot else 0,
+            max_entries=snapshot.CACHE_MAX_ENTRIES if snapshot else 0,
+            max_age=snapshot.CACHE_MAX_AGE if snapshot else 0,
+            pinned=snapshot.CACHE_PINNED if snapshot else ("diary.json", "tasks.json"),
+        )
+        self.Stats = CacheStats(self)
+        self.Blobs = CacheBlobStore(os.path.join(cache_path, ".blobs"), self)
         if not self.CacheExists():
-            import os
             os.makedirs(cache_path)
+        self.DATABASE = snapshot.CACHE_DATABASE if snapshot else "cache.sqlite3"
+        if snapshot and snapshot.CACHE_BACKEND == "sqlite":
+            self.Backend = SQLiteCacheBackend(os.path.join(cache_path, self.DATABASE))
+        else:
+            self.Backend = FileCacheBackend(self)
+        if self.Sweeper.IsLimited():
+            self.Sweeper.Start(snapshot.CACHE_SWEEP_INTERVAL)
         
         
-    def WriteCacheFile(self, filename, content):
-        with open(f"{self.CACHEPATH}/{filename}", 'w', encoding='utf-8') as f:
-            f.write(content)
+    def WriteCacheFile(self, filename, content, ttl=None):
+        data = CacheCompression.Pack(content, self.COMPRESSION, self.COMPRESS_THRESHOLD)
+        started = self.Stats.Clock()
+        stamp = self.Backend.Write(filename, data)
+        self.Stats.Written(len(data), started)
+        self.Memory.Invalidate(("object", filename))
+        if "\r" in content:
+            self.Memory.Invalidate(filename)  # text mode reads translate newlines, keep RAM identical to disk
+        else:
+            self.Memory.Put(filename, content, ttl=ttl, stamp=stamp)
             
     def ReadCacheFile(self, filename):
-        with open(f"{self.CACHEPATH}/{filename}", 'r', encoding='utf-8') as f:
-            return f.read()
+        # one stat per read: other instances, processes or mods writing the file with open() are noticed
+        stamp = self.Backend.Fingerprint(filename)
+        if stamp is not None:
+            content = self.Memory.Get(filename, stamp=stamp)
+            if content is not None:
+                self.Stats.MEMORY_HITS += 1
+                return content
+        started = self.Stats.Clock()
+        try:
+            data = self.Backend.Read(filename, binary=True)
+        except FileNotFoundError:
+            self.Stats.MISSES += 1
+            raise
+        self.Stats.Read(len(data), started)
+        content = CacheCompression.Text(data)
+        if stamp is not None:
+            self.Memory.Put(filename, content, stamp=stamp)  # stat before read: a later change still mismatches
+        return content
     
     def AddContent(self, filename, content):
-        with open(f"{self.CACHEPATH}/{filename}", 'a', encoding='utf-8') as f:
-            f.write(content + "\n")
+        if CacheCompression.IsPacked(self.Backend.Head(filename, 4)):
+            # a compressed entry cannot be appended to in place (also after compression was turned off)
+            with self.Lock(filename):
+                self.Memory.Invalidate(filename)
+                self.WriteCacheFile(filename, self.ReadCacheFile(filename) + content + "\n")
+            return
+        started = self.Stats.Clock()
+        self.Backend.Append(filename, content + "\n")
+        self.Stats.Written(len(content) + 1, started)
+        # not extended in place: another writer may have appended in between, the next read loads the file
+        self.Invalidate(filename)
             
     def RemoveCacheFile(self, filename):
-        import os
-        os.remove(f"{self.CACHEPATH}/{filename}")
+        self.Invalidate(filename)
+        self.Backend.Remove(filename)
+
+    def Lock(self, filename):
+        """with cache.Lock("tasks.json"): read, change, write -> no other process/thread in between.
+        Entering drops the in-memory copies of filename, so the read inside goes to the file."""
+        return FileLock(self.Path(filename), on_enter=lambda: self.Invalidate(filename))
+
+    def Invalidate(self, filename):
+        """Dropping the in-memory copies (raw and decoded) of filename"""
+        self.Memory.Invalidate(filename)
+        self.Memory.Invalidate(("object", filename))
+
+    #? Typed Values
+
+    def Set(self, key, value, serializer=None, ttl=None):
+        """Storing any object with a serializer ("json", "pickle", "marshal" or a registered one)"""
+        serializer = self.GetSerializer(serializer)
+        data = serializer.Dumps(value)
+        stored = CacheCompression.Pack(data, self.COMPRESSION, self.COMPRESS_THRESHOLD)
+        started = self.Stats.Clock()
+        stamp = self.Backend.Write(key, stored)
+        self.Stats.Written(len(stored), started)
+        self.Memory.Invalidate(key)
+        self.Memory.Put(("object", key), (serializer.NAME, value), ttl=ttl, size=len(data), stamp=stamp)
+
+    def Get(self, key, default=None, serializer=None):
+        """Loading an object stored with Set(). While the entry's fingerprint (one stat) is unchanged
+        the decoded object is returned without deserializing again, so treat the result as read-only."""
+        serializer = self.GetSerializer(serializer)
+        stamp = self.Backend.Fingerprint(key)
+        if stamp is None:
+            self.Memory.Invalidate(("object", key))
+            self.Stats.MISSES += 1
+            return default
+        entry = self.Memory.Get(("object", key), stamp=stamp)
+        if entry is not None and entry[0] == serializer.NAME:
+            self.Stats.MEMORY_HITS += 1
+            return entry[1]
+        started = self.Stats.Clock()
+        try:
+            data = self.Backend.Read(key, binary=True)
+        except FileNotFoundError:
+            self.Stats.MISSES += 1
+            return default
+        self.Stats.Read(len(data), started)
+        data = CacheCompression.Unpack(data)
+        if not serializer.BINARY:
+            data = data.decode('utf-8')
+        value = serializer.Loads(data)
+        self.Memory.Put(("object", key), (serializer.NAME, value), size=len(data), stamp=stamp)
+        return value
+
+    def GetSerializer(self, name=None):
+        try:
+            return self.SERIALIZERS[name or self.SERIALIZER]
+        except KeyError:
+            raise ValueError(f"Unbekannter Cache-Serializer: {name or self.SERIALIZER}") from None
+
+    def RegisterSerializer(self, serializer):
+        """Adding a serializer object with NAME, BINARY, Dumps(value) and Loads(data)"""
+        self.SERIALIZERS[serializer.NAME] = serializer
         
     def CacheExists(self, filename=None):
         import os
         if filename:
-            return os.path.exists(f"{self.CACHEPATH}/{filename}")
+            return self.Backend.Exists(filename)
         return os.path.exists(self.CACHEPATH)
 
+    def Batch(self):
+        """with cache.Batch(): ... -> groups many writes into one transaction (sqlite backend)"""
+        return self.Backend.Batch()
+
+    def Close(self):
+        self.Sweeper.Stop()
+        self.Stats.Stop()
+        self.Backend.Close()
+
+    #? Statistics
+
+    def GetStats(self):
+        """Snapshot of hits, misses, bytes, evictions and average latencies (ms) since start or ResetStats()"""
+        return self.Stats.Snapshot()
+
+    def ResetStats(self):
+        self.Stats.Reset()
+
+    def StartStatsLog(self, log, interval=60.0, filename="cache.log"):
+        """Writing GetStats() every interval seconds through a LogAPI (see "cache_stats_interval")"""
+        self.Stats.Start(log, interval, filename)
+
+    #? Warm-up
+
+    def Preload(self, entries, base=None):
+        """Reading entries into the memory tier, returns how many were found. An entry is a cache
+        name, {"cache": name, "serializer": "json"} (decoded tier) or {"file": path} (relative to
+        the entry's "base" or base, only warms the OS page cache). Missing entries are skipped."""
+        import os
+        loaded = 0
+        for entry in entries:
+            if isinstance(entry, str):
+                entry = {"cache": entry}
+            try:
+                if "cache" in entry:
+                    if entry.get("serializer"):
+                        missing = object()
+                        if self.Get(entry["cache"], missing, entry["serializer"]) is missing:
+                            continue
+                    else:
+                        self.ReadCacheFile(entry["cache"])
+                elif "file" in entry:
+                    path = os.path.join(entry.get("base") or base or "", entry["file"].replace("\\", os.sep))
+                    for _ in BinaryReader.IterChunks(path):
+                        pass
+                else:
+                    continue
+            except (OSError, ValueError):
+                continue
+            loaded += 1
+        return loaded
+
+    def Prefetch(self, entries, base=None):
+        """Preload() in a background thread, so startup does not wait for the disk"""
+        import threading
+        entries = list(entries)
+        if not entries:
+            return None
+        thread = threading.Thread(target=self.Preload, args=(entries, base), name="CachePrefetch", daemon=True)
+        thread.start()
+        return thread
+
+    #? Memoization
+
+    def Memoize(self, ttl=None, key=None, version=None, serializer="pickle"):
+        """@app.Cache.memoize(ttl=3600, version="2") -> results are kept in memory and on disk across launches.
+        key(*args, **kwargs) replaces the argument hash, changing version invalidates all old results."""
+        import functools
+        import re
+        import threading
+        cache = self
+        missing = object()
+
+        def decorator(function):
+            name = re.sub(r"[^A-Za-z0-9_.]", "_", f"{function.__module__}.{function.__qualname__}")
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                import time
+                cache_key = cache.MemoizeKey(name, version, key(*args, **kwargs) if key else (args, sorted(kwargs.items())))
+                if cache_key is None:
+                    return function(*args, **kwargs)  # arguments are not hashable by pickle
+                entry = cache.Get(cache_key, missing, serializer)
+                if entry is not missing and (not entry[0] or entry[0] > time.time()):
+                    return entry[1]
+                with cache.lock:
+                    pending = cache.INFLIGHT.get(cache_key)
+                    leader = pending is None
+                    if leader:
+                        pending = cache.INFLIGHT[cache_key] = {"done": threading.Event(), "result": None, "error": None}
+                if not leader:
+                    pending["done"].wait()
+                    if pending["error"] is not None:
+                        raise pending["error"]
+                    return pending["result"]
+                try:
+                    entry = cache.Get(cache_key, missing, serializer)  # a previous leader may have just finished
+                    if entry is not missing and (not entry[0] or entry[0] > time.time()):
+                        pending["result"] = entry[1]
+                        return entry[1]
+                    result = function(*args, **kwargs)
+                    pending["result"] = result
+                    try:
+                        cache.Set(cache_key, (time.time() + ttl if ttl else 0, result), serializer, ttl=ttl)
+                    except Exception:
+                        pass  # result cannot be serialized (e.g. a lock): returned, just not cached
+                    return result
+                except BaseException as error:
+                    pending["error"] = error
+                    raise
+                finally:
+                    with cache.lock:
+                        cache.INFLIGHT.pop(cache_key, None)
+                    pending["done"].set()
+
+            wrapper.MemoName = name
+            return wrapper
+        return decorator
+
+    memoize = Memoize  # decorator spelling: @app.Cache.memoize(...)
+
+    @staticmethod
+    def MemoizeKey(name, version, arguments):
+        import hashlib
+        import pickle
+        try:
+            payload = pickle.dumps((version, arguments), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+        return f"memo.{name}.{hashlib.sha1(payload).hexdigest()}"
+
+    #? Binary Reads
+
+    def ReadCacheBytes(self, filename):
+        """Raw bytes without decoding (decompressed)"""
+        return CacheCompression.Unpack(self.Backend.Read(filename, binary=True))
+
+    def ReadCacheView(self, filename):
+        """memoryview of the entry, memory-mapped for large files (slicing copies nothing).
+        Compressed entries are decompressed into memory."""
+        view = self.Backend.View(filename)
+        if CacheCompression.IsPacked(view):
+            return memoryview(CacheCompression.Unpack(view))
+        return view
+
+    def MapCacheFile(self, filename):
+        """with cache.MapCacheFile(name) as m: ... -> read-only mmap of the stored bytes, closed on exit.
+        Compressed entries are decompressed into memory, as in ReadCacheView."""
+        mapped = self.Backend.Map(filename)
+        if not CacheCompression.IsPacked(mapped):
+            return mapped
+        with mapped:
+            return memoryview(CacheCompression.Unpack(mapped))
+
+    def IterCacheChunks(self, filename, chunk_size=64 * 1024):
+        """Streaming the bytes as memoryview chunks of one reused buffer (valid until the next chunk).
+        Compressed entries are decompressed while streaming, in chunks of at most chunk_size."""
+        return CacheCompression.IterUnpack(self.Backend.IterChunks(filename, chunk_size), chunk_size)
+
+    #? Eviction
+
+    def Pin(self, filename):
+        """Protecting an entry (e.g. a mod's data store) from eviction"""
+        self.Sweeper.PINNED.add(filename)
+
+    def Unpin(self, filename):
+        self.Sweeper.PINNED.discard(filename)
+
+    def Sweep(self):
+        """Enforcing max age/bytes/entries now, returns {"files": n, "bytes": b} that were evicted"""
+        return self.Sweeper.Sweep()
+
+    #? Deduplicated Blobs
+
+    def PutBlob(self, name, content):
+        """Storing content under name in the content-addressed store, returns its sha256.
+        Content that is already stored (under any name) only adds a reference."""
+        return self.Blobs.Put(name, content)
+
+    def GetBlob(self, name, binary=False):
+        return self.Blobs.Read(name, binary)
+
+    def RemoveBlob(self, name):
+        """Dropping the reference, the blob is deleted with its last reference"""
+        self.Blobs.Remove(name)
+
+    def BlobExists(self, name):
+        return self.Blobs.Exists(name)
+
+    def CollectBlobs(self):
+        """Deleting unreferenced blobs and leftovers of interrupted writes, returns {"files": n, "bytes": b}"""
+        return self.Blobs.Collect()
+
+    #? Layout
+
+    def Path(self, filename):
+        """Mapping a key to its file: flat {cachepath}/{key} or sharded {cachepath}/ab/cd/{key}.
+        The FLAT names (mod data opened by path, e.g. diary.json) always stay flat."""
+        if not self.SHARDED or filename in self.FLAT:
+            return f"{self.CACHEPATH}/{filename}"
+        import hashlib
+        digest = hashlib.blake2b(filename.encode('utf-8'), digest_size=2).hexdigest()
+        return f"{self.CACHEPATH}/{digest[:2]}/{digest[2:]}/{filename}"
+
+    def WritePath(self, filename):
+        path = self.Path(filename)
+        if self.SHARDED and filename not in self.FLAT:
+            import os
+            directory = os.path.dirname(path)
+            if directory not in self.SHARDS:
+                os.makedirs(directory, exist_ok=True)
+                self.SHARDS.add(directory)
+        return path
+
+    def MigrateToSharded(self, keep=None):
+        """Moving the entries of an existing flat cache into the sharded layout and switching to it.
+        The FLAT names (default "cache_flat": diary.json, tasks.json, opened by path by mods) and the
+        names in keep stay flat; keep is pinned as well. Layout and flat names are saved to the settings
+        ("cache_sharded", "cache_flat"), otherwise the next launch would look in the flat layout.
+        Only for the file backend; an already sharded cache is left as it is (returns 0)."""
+        import os
+        if not isinstance(self.Backend, FileCacheBackend):
+            raise ValueError(f"MigrateToSharded gilt nur für das Datei-Backend, nicht für {type(self.Backend).__name__}")
+        if self.SHARDED:
+            return 0
+        database = {self.DATABASE + suffix for suffix in ("", "-wal", "-shm", "-journal")}  # from an earlier sqlite backend
+        self.FLAT = self.FLAT | frozenset(keep or ())
+        for name in keep or ():
+            self.Pin(name)
+        self.SHARDED = True
+        with os.scandir(self.CACHEPATH) as entries:
+            names = [
+                entry.name for entry in entries
+                if entry.is_file(follow_symlinks=False) and not entry.name.startswith(".")
+                and entry.name not in self.FLAT and entry.name not in database
+            ]
+        for name in names:
+            os.replace(os.path.join(self.CACHEPATH, name), self.WritePath(name))
+        if hasattr(self.Settings, "Set"):
+            with self.Settings.Transaction():
+                self.Settings.Set("cache_sharded", True)
+                self.Settings.Set("cache_flat", sorted(self.FLAT))
+                self.Settings.Set("cache_pinned", sorted(self.Sweeper.PINNED))
+        return len(names)
+
+    #? ################  CACHE BACKENDS #####################
+
+class FileCacheBackend:
+    """One file per key below the cache path (flat or sharded, see CacheAPI.Path)"""
+
+    def __init__(self, cache):
+        self.Cache = cache
+
+    def Write(self, key, data):
+        """Returns the fingerprint of the written entry"""
+        st = AtomicFile.Write(self.Cache.WritePath(key), data)
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def Fingerprint(self, key):
+        """(inode, size, mtime) of the entry, None if it does not exist. Any writer changes it,
+        including mods that open() the file directly."""
+        import os
+        try:
+            st = os.stat(self.Cache.Path(key))
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def Read(self, key, binary=False):
+        if binary:
+            return BinaryReader.ReadBytes(self.Cache.Path(key))
+        with open(self.Cache.Path(key), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def Append(self, key, text):
+        AtomicFile.Append(self.Cache.WritePath(key), text)
+
+    def Head(self, key, size):
+        """First size bytes of the entry, b"" if it does not exist"""
+        try:
+            with open(self.Cache.Path(key), 'rb') as f:
+                return f.read(size)
+        except FileNotFoundError:
+            return b""
+
+    def Remove(self, key):
+        import os
+        os.remove(self.Cache.Path(key))
+
+    def Exists(self, key):
+        import os
+        return os.path.exists(self.Cache.Path(key))
+
+    def View(self, key):
+        return BinaryReader.View(self.Cache.Path(key))
+
+    def Map(self, key):
+        return BinaryReader.Map(self.Cache.Path(key))
+
+    def IterChunks(self, key, chunk_size):
+        return BinaryReader.IterChunks(self.Cache.Path(key), chunk_size)
+
+    def Scan(self):
+        """Returning [(mtime, size, path, key)] of all files below the cache path (scandir metadata only)"""
+        import os
+        root = self.Cache.CACHEPATH
+        found = []
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            try:
+                                st = entry.stat(follow_symlinks=False)
+                            except OSError:
+                                continue
+                            key = entry.name if self.Cache.SHARDED else os.path.relpath(entry.path, root).replace(os.sep, "/")
+                            found.append((st.st_mtime, st.st_size, entry.path, key))
+            except OSError:
+                continue
+        return found
+
+    def Evict(self, path):
+        import os
+        os.remove(path)
+
+    def Batch(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def Close(self):
+        pass
+
+
+class SQLiteCacheBackend:
+    """All entries in one local SQLite database (WAL). Saves an open/write/close per small entry;
+    statements are constant strings, so sqlite3 reuses its prepared statements."""
+
+    def __init__(self, database):
+        import sqlite3
+        import threading
+        self.DATABASE = database
+        self.lock = threading.RLock()
+        self.depth = 0
+        self.connection = sqlite3.connect(database, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, mtime REAL NOT NULL)"
+        )
+
+    def Execute(self, sql, parameters=()):
+        with self.lock:
+            return self.connection.execute(sql, parameters)
+
+    def Write(self, key, data):
+        import time
+        mtime = time.time()
+        self.Execute(
+            "INSERT INTO entries (key, value, mtime) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, mtime = excluded.mtime",
+            (key, data, mtime),
+        )
+        return (mtime, len(data.encode('utf-8')) if isinstance(data, str) else len(data))
+
+    def Fingerprint(self, key):
+        """(mtime, byte length) of the entry, None if it does not exist"""
+        row = self.Execute("SELECT mtime, length(CAST(value AS BLOB)) FROM entries WHERE key = ?", (key,)).fetchone()
+        return None if row is None else (row[0], row[1])
+
+    def Read(self, key, binary=False):
+        row = self.Execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Cache-Eintrag nicht gefunden: {key}")
+        value = row[0]
+        if binary:
+            return value.encode('utf-8') if isinstance(value, str) else value
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    def Append(self, key, text):
+        import time
+        self.Execute(
+            "INSERT INTO entries (key, value, mtime) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = value || excluded.value, mtime = excluded.mtime",
+            (key, text, time.time()),
+        )
+
+    def Head(self, key, size):
+        row = self.Execute("SELECT substr(CAST(value AS BLOB), 1, ?) FROM entries WHERE key = ?", (size, key)).fetchone()
+        return row[0] if row else b""
+
+    def Remove(self, key):
+        if self.Execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount == 0:
+            raise FileNotFoundError(f"Cache-Eintrag nicht gefunden: {key}")
+
+    def Exists(self, key):
+        return self.Execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is not None
+
+    def View(self, key):
+        return memoryview(self.Read(key, binary=True))
+
+    def Map(self, key):
+        return self.View(key)  # memoryview is a context manager as well
+
+    def IterChunks(self, key, chunk_size):
+        view = self.View(key)
+        for offset in range(0, len(view), chunk_size):
+            yield view[offset:offset + chunk_size]
+
+    def Scan(self):
+        rows = self.Execute("SELECT mtime, length(CAST(value AS BLOB)), key FROM entries").fetchall()
+        return [(mtime, size, key, key) for mtime, size, key in rows]
+
+    def Evict(self, key):
+        self.Execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def Batch(self):
+        return self
+
+    def __enter__(self):
+        self.lock.acquire()
+        if self.depth == 0:
+            self.connection.execute("BEGIN")
+        self.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.depth -= 1
+            if self.depth == 0:
+                self.connection.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.lock.release()
+        return False
+
+    def Close(self):
+        with self.lock:
+            self.connection.close()
+
+    #? ################  CACHE SWEEPER #####################
+
+class CacheSweeper:
+    """Evicts cache entries by age, total bytes and entry count (oldest mtime first).
+    Works on backend metadata only (os.scandir for files), pinned names and dotfiles are never removed."""
+
+    def __init__(self, cache, max_bytes=0, max_entries=0, max_age=0, pinned=()):
+        import threading
+        self.Cache = cache
+        self.MAX_BYTES = max_bytes
+        self.MAX_ENTRIES = max_entries
+        self.MAX_AGE = max_age
+        self.PINNED = set(pinned)
+        self.EVICTED = 0
+        self.stopping = threading.Event()
+        self.thread = None
+
+    def IsLimited(self):
+        return bool(self.MAX_BYTES or self.MAX_ENTRIES or self.MAX_AGE)
+
+    def IsPinned(self, key):
+        import os
+        return key in self.PINNED or os.path.basename(key) in self.PINNED
+
+    def Sweep(self):
+        import time
+        entries = self.Cache.Backend.Scan()
+        total_bytes = sum(size for _, size, _, _ in entries)
+        total_entries = len(entries)
+        now = time.time()
+        evicted = {"files": 0, "bytes": 0}
+        for mtime, size, handle, key in sorted(entries, key=lambda entry: entry[0]):
+            if self.IsPinned(key):
+                continue
+            expired = self.MAX_AGE and now - mtime > self.MAX_AGE
+            too_big = self.MAX_BYTES and total_bytes > self.MAX_BYTES
+            too_many = self.MAX_ENTRIES and total_entries > self.MAX_ENTRIES
+            if not (expired or too_big or too_many):
+                if not self.MAX_AGE:
+                    break  # sorted by age: nothing older left to evict
+                continue
+            try:
+                self.Cache.Backend.Evict(handle)
+            except OSError:
+                continue
+            self.Cache.Invalidate(key)
+            total_bytes -= size
+            total_entries -= 1
+            evicted["files"] += 1
+            evicted["bytes"] += size
+        self.EVICTED += evicted["files"]
+        return evicted
+
+    def IsRunning(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def Start(self, interval=60.0):
+        import threading
+        if self.IsRunning():
+            return
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self._Loop, args=(interval,), name="CacheSweeper", daemon=True)
+        self.thread.start()
+
+    def Stop(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+        self.thread = None
+
+    def _Loop(self, interval):
+        while not self.stopping.wait(interval):
+            try:
+                self.Sweep()
+            except Exception:
+                pass  # never let housekeeping kill the process
+
+    #? ################  CACHE STATS #####################
+
+class CacheStats:
+    """Counters of one CacheAPI. Plain integer increments and one perf_counter_ns pair per backend
+    access (memory hits are not timed), cheap enough to stay on all the time."""
+
+    def __init__(self, cache):
+        import threading
+        self.Cache = cache
+        self.stopping = threading.Event()
+        self.thread = None
+        self.Reset()
+
+    def Reset(self):
+        import time
+        self.STARTED = time.time()
+        self.MEMORY_HITS = 0
+        self.DISK_HITS = 0
+        self.MISSES = 0
+        self.BYTES_READ = 0
+        self.BYTES_WRITTEN = 0
+        self.READS = 0
+        self.WRITES = 0
+        self.READ_NS = 0
+        self.WRITE_NS = 0
+        self.evicted = (self.Cache.Sweeper.EVICTED, self.Cache.Memory.EVICTED)  # baselines, both count for the whole lifetime
+
+    @staticmethod
+    def Clock():
+        import time
+        return time.perf_counter_ns()
+
+    def Read(self, size, started):
+        self.READ_NS += self.Clock() - started
+        self.READS += 1
+        self.DISK_HITS += 1
+        self.BYTES_READ += size
+
+    def Written(self, size, started):
+        self.WRITE_NS += self.Clock() - started
+        self.WRITES += 1
+        self.BYTES_WRITTEN += size
+
+    def Snapshot(self):
+        import time
+        hits = self.MEMORY_HITS + self.DISK_HITS
+        lookups = hits + self.MISSES
+        return {
+            "uptime": round(time.time() - self.STARTED, 3),
+            "hits": hits,
+            "memory_hits": self.MEMORY_HITS,
+            "disk_hits": self.DISK_HITS,
+            "misses": self.MISSES,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "bytes_read": self.BYTES_READ,
+            "bytes_written": self.BYTES_WRITTEN,
+            "evictions": self.Cache.Sweeper.EVICTED - self.evicted[0],
+            "memory_evictions": self.Cache.Memory.EVICTED - self.evicted[1],
+            "memory_bytes": self.Cache.Memory.BYTES,
+            "avg_read_ms": round(self.READ_NS / self.READS / 1e6, 4) if self.READS else 0.0,
+            "avg_write_ms": round(self.WRITE_NS / self.WRITES / 1e6, 4) if self.WRITES else 0.0,
+        }
+
+    def IsRunning(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def Start(self, log, interval=60.0, filename="cache.log"):
+        import threading
+        if self.IsRunning():
+            return
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self._Loop, args=(log, interval, filename), name="CacheStats", daemon=True)
+        self.thread.start()
+
+    def Stop(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+        self.thread = None
+
+    def _Loop(self, log, interval, filename):
+        import json
+        while not self.stopping.wait(interval):
+            try:
+                log.WriteLog(filename, f"cache {self.Cache.CACHEPATH} {json.dumps(self.Snapshot())}")
+            except Exception:
+                pass
+
+    #? ################  CACHE BLOB STORE #####################
+
+class CacheBlobStore:
+    """Content-addressed store below {cachepath}/.blobs: objects/ab/<sha256> holds each payload once,
+    refs.json maps names to hashes. Reference counts are derived from refs.json on load.
+    The directory starts with a dot, so the sweeper and MigrateToSharded leave it alone."""
+
+    def __init__(self, path, cache=None):
+        import threading
+        from collections import Counter
+        self.PATH = path
+        self.REFS_PATH = f"{path}/refs.json"
+        self.Cache = cache
+        self.lock = threading.RLock()
+        self.REFS = {}
+        self.COUNTS = Counter()
+        self.refs_state = None  # (inode, size, mtime) of refs.json as last read or written
+        self.Reload()
+
+    def Reload(self):
+        """Re-reading refs.json, other processes may have changed it (callers hold the FileLock)"""
+        from collections import Counter
+        state = self.RefsState()  # stat before read: a later change still mismatches
+        self.REFS = self.LoadRefs()
+        self.COUNTS = Counter(self.REFS.values())
+        self.refs_state = state
+
+    def RefsState(self):
+        import os
+        try:
+            st = os.stat(self.REFS_PATH)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def Refresh(self):
+        """Taking over names other processes added or removed, one stat while refs.json is unchanged"""
+        if self.RefsState() != self.refs_state:
+            with self.lock:
+                self.Reload()
+
+    def LoadRefs(self):
+        import json
+        try:
+            with open(self.REFS_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def SaveRefs(self):
+        import json
+        import os
+        os.makedirs(self.PATH, exist_ok=True)
+        st = AtomicFile.Write(self.REFS_PATH, json.dumps(self.REFS, indent=1, sort_keys=True), durable=True)
+        self.refs_state = (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def ObjectPath(self, digest):
+        return f"{self.PATH}/objects/{digest[:2]}/{digest}"
+
+    def Put(self, name, content):
+        import hashlib
+        import os
+        raw = content.encode('utf-8') if isinstance(content, str) else bytes(content)
+        digest = hashlib.sha256(raw).hexdigest()
+        with self.lock, FileLock(self.REFS_PATH):
+            self.Reload()
+            if self.REFS.get(name) == digest:
+                return digest
+            path = self.ObjectPath(digest)
+            if not self.COUNTS[digest] and not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if self.Cache is not None:
+                    raw = CacheCompression.Pack(raw, self.Cache.COMPRESSION, self.Cache.COMPRESS_THRESHOLD)
+                AtomicFile.Write(path, raw, durable=True)
+            previous = self.REFS.get(name)
+            self.REFS[name] = digest
+            self.COUNTS[digest] += 1
+            self.SaveRefs()
+            if previous is not None:
+                self.Release(previous)
+        return digest
+
+    def Read(self, name, binary=False):
+        self.Refresh()
+        with self.lock:
+            digest = self.REFS.get(name)
+        if digest is None:
+            raise FileNotFoundError(f"Blob nicht gefunden: {name}")
+        memory = self.Cache.Memory if self.Cache is not None else None
+        data = memory.Get(("blob", digest)) if memory is not None else None
+        if data is None:
+            data = CacheCompression.Unpack(BinaryReader.ReadBytes(self.ObjectPath(digest)))
+            if memory is not None:
+                memory.Put(("blob", digest), data, size=len(data))  # immutable, never needs invalidation
+        return data if binary else data.decode('utf-8')
+
+    def Remove(self, name):
+        with self.lock, FileLock(self.REFS_PATH):
+            self.Reload()
+            digest = self.REFS.pop(name, None)
+            if digest is None:
+                raise FileNotFoundError(f"Blob nicht gefunden: {name}")
+            self.SaveRefs()
+            self.Release(digest)
+
+    def Release(self, digest):
+        import os
+        self.COUNTS[digest] -= 1
+        if self.COUNTS[digest] > 0:
+            return
+        del self.COUNTS[digest]
+        if self.Cache is not None:
+            self.Cache.Memory.Invalidate(("blob", digest))
+        try:
+            os.remove(self.ObjectPath(digest))
+        except FileNotFoundError:
+            pass
+
+    def Exists(self, name):
+        self.Refresh()
+        return name in self.REFS
+
+    def Digest(self, name):
+        self.Refresh()
+        return self.REFS.get(name)
+
+    def Collect(self):
+        """Garbage collection: objects without references (e.g. after a crash between blob and
+        refs write) and stale temp files of AtomicFile.Write"""
+        import os
+        freed = {"files": 0, "bytes": 0}
+        root = f"{self.PATH}/objects"
+        with self.lock, FileLock(self.REFS_PATH):
+            self.Reload()  # holding the lock also means no other process is writing a blob right now
+            referenced = set(self.COUNTS)
+            try:
+                shards = [entry.path for entry in os.scandir(root) if entry.is_dir(follow_symlinks=False)]
+            except FileNotFoundError:
+                return freed
+            for shard in shards:
+                with os.scandir(shard) as entries:
+                    for entry in entries:
+                        if entry.name in referenced or not entry.is_file(follow_symlinks=False):
+                            continue
+                        try:
+                            size = entry.stat(follow_symlinks=False).st_size
+                            os.remove(entry.path)
+                        except OSError:
+                            continue
+                        freed["files"] += 1
+                        freed["bytes"] += size
+        return freed
+
+    #? ################  CACHE COMPRESSION #####################
+
+class CacheCompression:
+    """Transparent compression of stored cache entries above a size threshold. Compressed entries
+    start with a 4 byte header (NUL, "TC", codec id). Text and JSON never start with NUL, so
+    plain entries are recognised without any metadata and stay readable when compression is off."""
+
+    MAGIC = b"\x00TC"
+    CODECS = {"zlib": b"z", "lzma": b"x"}
+
+    @classmethod
+    def Pack(cls, data, codec="zlib", threshold=0):
+        if not threshold or len(data) < threshold:
+            return data
+        raw = data.encode('utf-8') if isinstance(data, str) else data
+        if codec == "zlib":
+            import zlib
+            packed = zlib.compress(raw, 1)  # fast level, lzma is the option for space
+        elif codec == "lzma":
+            import lzma
+            packed = lzma.compress(raw, preset=1)
+        else:
+            raise ValueError(f"Unbekannte Cache-Kompression: {codec}")
+        if len(packed) + len(cls.MAGIC) + 1 >= len(raw):
+            return data  # incompressible, keep the plain entry
+        return cls.MAGIC + cls.CODECS[codec] + packed
+
+    @classmethod
+    def IsPacked(cls, data):
+        return data[:3] == cls.MAGIC
+
+    @classmethod
+    def Unpack(cls, data):
+        if data[:3] != cls.MAGIC:
+            return data
+        codec = bytes(data[3:4])
+        if codec == b"z":
+            import zlib
+            return zlib.decompress(data[4:])
+        if codec == b"x":
+            import lzma
+            return lzma.decompress(data[4:])
+        raise ValueError(f"Unbekannte Cache-Kompression im Eintrag: {codec!r}")
+
+    @classmethod
+    def IterUnpack(cls, chunks, chunk_size=64 * 1024):
+        """Stored chunks -> decompressed chunks of at most chunk_size bytes (zlib.decompressobj,
+        lzma.LZMADecompressor), without holding the whole entry. Plain entries pass through."""
+        import itertools
+        chunks = iter(chunks)
+        head = b""
+        for chunk in chunks:
+            head += bytes(chunk)
+            if len(head) > len(cls.MAGIC):
+                break
+        if head[:3] != cls.MAGIC:
+            if head:
+                yield memoryview(head)
+            yield from chunks
+            return
+        codec = head[3:4]
+        if codec == b"z":
+            import zlib
+            decompressor = zlib.decompressobj()
+        elif codec == b"x":
+            import lzma
+            decompressor = lzma.LZMADecompressor()
+        else:
+            raise ValueError(f"Unbekannte Cache-Kompression im Eintrag: {codec!r}")
+        for data in itertools.chain((head[4:],), chunks):
+            while not decompressor.eof:
+                out = decompressor.decompress(data, chunk_size)
+                if out:
+                    yield memoryview(out)
+                # zlib hands back the input it could not expand yet, lzma buffers it and is drained with b""
+                if codec == b"z":
+                    data = decompressor.unconsumed_tail
+                    if not data:
+                        break
+                elif decompressor.needs_input:
+                    break
+                else:
+                    data = b""
+        if codec == b"z":
+            out = decompressor.flush()
+            if out:
+                yield memoryview(out)
+
+    @classmethod
+    def Text(cls, data):
+        """Stored bytes -> str with the newline translation of a text mode read"""
+        text = cls.Unpack(data).decode('utf-8')
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    #? ################  CACHE SERIALIZERS #####################
+
+class CacheSerializer:
+    """Base for CacheAPI.Set/Get serializers. BINARY serializers return bytes, the others str."""
+
+    NAME = None
+    BINARY = False
+
+    def Dumps(self, value):
+        raise NotImplementedError
+
+    def Loads(self, data):
+        raise NotImplementedError
+
+
+class JsonSerializer(CacheSerializer):
+    NAME = "json"
+
+    def Dumps(self, value):
+        import json
+        return json.dumps(value, ensure_ascii=False)
+
+    def Loads(self, data):
+        import json
+        return json.loads(data)
+
+
+class PickleSerializer(CacheSerializer):
+    """Any picklable object. Only load pickles the application wrote itself."""
+    NAME = "pickle"
+    BINARY = True
+
+    def Dumps(self, value):
+        import pickle
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def Loads(self, data):
+        import pickle
+        return pickle.loads(data)
+
+
+class MarshalSerializer(CacheSerializer):
+    """Fastest for plain builtins (dict, list, str, int, ...), format tied to the Python version"""
+    NAME = "marshal"
+    BINARY = True
+
+    def Dumps(self, value):
+        import marshal
+        return marshal.dumps(value)
+
+    def Loads(self, data):
+        import marshal
+        return marshal.loads(data)
+
+
+    #? ################  CACHE MEMORY #####################
+
+class CacheMemory:
+    """Bounded LRU of decoded cache entries with optional per-entry TTL (seconds, 0 = no expiry)"""
+
+    def __init__(self, max_bytes=4 * 1024 * 1024, ttl=0):
+        from collections import OrderedDict
+        import threading
+        self.MAX_BYTES = max_bytes
+        self.TTL = ttl
+        self.ENTRIES = OrderedDict()  # key -> (value, size, expires, stamp)
+        self.BYTES = 0
+        self.EVICTED = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def SizeOf(value):
+        import sys
+        return sys.getsizeof(value)
+
+    def Get(self, key, default=None, stamp=None):
+        """stamp: current fingerprint of the source, an entry stored with another one is dropped"""
+        with self.lock:
+            entry = self.ENTRIES.get(key)
+            if entry is None:
+                return default
+            value, size, expires, stored = entry
+            if (expires and expires < self.Now()) or (stamp is not None and stored != stamp):
+                del self.ENTRIES[key]
+                self.BYTES -= size
+                return default
+            self.ENTRIES.move_to_end(key)
+            return value
+
+    def Put(self, key, value, ttl=None, size=None, stamp=None):
+        if self.MAX_BYTES <= 0:
+            return
+        if size is None:
+            size = self.SizeOf(value)
+        if ttl is None:
+            ttl = self.TTL
+        expires = self.Now() + ttl if ttl else 0
+        with self.lock:
+            old = self.ENTRIES.pop(key, None)
+            if old is not None:
+                self.BYTES -= old[1]
+            if size > self.MAX_BYTES:
+                return  # larger than the whole tier, serve it from disk
+            self.ENTRIES[key] = (value, size, expires, stamp)
+            self.BYTES += size
+            self._Evict()
+
+    def _Evict(self):
+        while self.BYTES > self.MAX_BYTES and self.ENTRIES:
+            _, (_, evicted, _, _) = self.ENTRIES.popitem(last=False)
+            self.BYTES -= evicted
+            self.EVICTED += 1
+
+    def Invalidate(self, key):
+        with self.lock:
+            entry = self.ENTRIES.pop(key, None)
+            if entry is not None:
+                self.BYTES -= entry[1]
+
+    def Clear(self):
+        with self.lock:
+            self.ENTRIES.clear()
+            self.BYTES = 0
+
+    @staticmethod
+    def Now():
+        import time
+        return time.monotonic()
+
     #? ################  TEMP API #####################
 
 class TempAPI:
+
+    MANIFEST = ".manifest"  # names of created temp files, one per line, so a crashed run is cleaned up later
     
-    def __init__(self, temp_path):
+    def __init__(self, temp_path, settings=None):
+        import threading
         self.TEMPPATH = temp_path
+        snapshot = getattr(settings, "Snapshot", None)
         if not self.TempExists():
             import os
             os.makedirs(temp_path)
+        self.lock = threading.Lock()
+        self.FILES = set()  # temp files created through this instance (plus manifest leftovers)
+        self.REMOVED = set()  # removed one by one, dropped from the manifest with the next Cleanup()
+        self.SPOOL_SIZE = snapshot.TEMP_SPOOL_SIZE if snapshot else 0  # characters, 0 = always on disk
+        self.SPOOLED = {}  # filename -> content of entries that live in memory only (this process)
+        self.manifest_state = None
+        self.LoadManifest()
+        self.Cleaner = TempCleaner(self, max_age=snapshot.TEMP_MAX_AGE if snapshot else 0)
+        self.stopping = threading.Event()
+        self.thread = None
+        self.CLEANUP_INTERVAL = snapshot.TEMP_CLEANUP_INTERVAL if snapshot else 0
+        if self.CLEANUP_INTERVAL:
+            self.StartCleanup(self.CLEANUP_INTERVAL)
         
     def WriteTempFile(self, filename, content):
-        with open(f"{self.TEMPPATH}/{filename}", 'w', encoding='utf-8') as f:
-            f.write(content)
+        if self.SPOOL_SIZE and len(content) <= self.SPOOL_SIZE:
+            self.Spool(filename, content)
+            return
+        self.WriteDisk(filename, content)
+
+    def WriteDisk(self, filename, content):
+        with self.lock:
+            self.SPOOLED.pop(filename, None)
+        self.Track(filename)
+        AtomicFile.Write(f"{self.TEMPPATH}/{filename}", content)
             
     def ReadTempFile(self, filename):
+        content = self.SPOOLED.get(filename)
+        if content is not None:
+            return content
         with open(f"{self.TEMPPATH}/{filename}", 'r', encoding='utf-8') as f:
             return f.read()
         
     def AddContent(self, filename, content):
-        with open(f"{self.TEMPPATH}/{filename}", 'a', encoding='utf-8') as f:
-            f.write(content + "\n")
+        if self.SPOOL_SIZE:
+            import os
+            with self.lock:
+                current = self.SPOOLED.get(filename)
+                if current is None and filename not in self.FILES and not os.path.exists(f"{self.TEMPPATH}/{filename}"):
+                    current = ""
+                if current is not None:
+                    current += content + "\n"
+                    if len(current) <= self.SPOOL_SIZE:
+                        self.SPOOLED[filename] = current
+                        return
+            if current is not None:
+                self.WriteDisk(filename, current)  # grew beyond the spool size
+                return
+        self.Track(filename)
+        AtomicFile.Append(f"{self.TEMPPATH}/{filename}", content + "\n")
+
+    #? Spooling
+
+    def Spool(self, filename, content):
+        """Keeping the entry in memory, a file of the same name written through TempAPI before is removed"""
+        with self.lock:
+            self.SPOOLED[filename] = content
+            on_disk = filename in self.FILES
+        if on_disk:
+            self.RemoveDiskFile(filename)
+
+    def IsSpooled(self, filename):
+        return filename in self.SPOOLED
+
+    def OpenTempFile(self, filename, mode="w"):
+        """with temp.OpenTempFile("scratch.txt", "a") as f: f.write(...) -> file-like handle,
+        in memory up to "temp_spool_size" characters, on disk beyond"""
+        return SpooledTempFile(self, filename, mode)
+
+    def SpooledBytes(self, filename):
+        content = self.SPOOLED.get(filename)
+        return None if content is None else content.encode('utf-8')
+
+    def Lock(self, filename):
+        return FileLock(f"{self.TEMPPATH}/{filename}")
+    
+    def ReadTempBytes(self, filename):
+        data = self.SpooledBytes(filename)
+        if data is not None:
+            return data
+        return BinaryReader.ReadBytes(f"{self.TEMPPATH}/{filename}")
+
+    def ReadTempView(self, filename):
+        data = self.SpooledBytes(filename)
+        if data is not None:
+            return memoryview(data)
+        return BinaryReader.View(f"{self.TEMPPATH}/{filename}")
+
+    def MapTempFile(self, filename):
+        data = self.SpooledBytes(filename)
+        if data is not None:
+            return memoryview(data)  # context manager as well
+        return BinaryReader.Map(f"{self.TEMPPATH}/{filename}")
+
+    def IterTempChunks(self, filename, chunk_size=64 * 1024):
+        data = self.SpooledBytes(filename)
+        if data is not None:
+            view = memoryview(data)
+            return (view[offset:offset + chunk_size] for offset in range(0, len(view), chunk_size))
+        return BinaryReader.IterChunks(f"{self.TEMPPATH}/{filename}", chunk_size)
     
     def TempExists(self, filename=None):
         import os
         if filename:
-            return os.path.exists(f"{self.TEMPPATH}/{filename}")
+            return filename in self.SPOOLED or os.path.exists(f"{self.TEMPPATH}/{filename}")
         return os.path.exists(self.TEMPPATH)
 
     def RemoveTempFile(self, filename=None):
-        if not filename: # leere Temp ordner
-            import os
-            for file in os.listdir(self.TEMPPATH):
-                file_path = os.path.join(self.TEMPPATH, file)
-                try:
-                    if os.path.isfile(file_path):
-                        os.remove(file_path)
-                except Exception:
-                    pass
+        if not filename: # leere Temp ordner (mit Unterordnern)
+            self.Cleaner.Run(max_age=0)
+            with self.lock:
+                self.FILES.clear()
+                self.REMOVED.clear()
+                self.SPOOLED.clear()
+            self.Forget(None)
             return True
+        with self.lock:
+            if self.SPOOLED.pop(filename, None) is not None:
+                return None
+        return self.RemoveDiskFile(filename)
+
+    def RemoveDiskFile(self, filename):
         try:
             import os
             os.remove(f"{self.TEMPPATH}/{filename}")
         except Exception:
             return False
+        with self.lock:
+            if filename in self.FILES:
+                self.FILES.discard(filename)
+                self.REMOVED.add(filename)
+
+    #? Directory Cleanup
+
+    def PurgeTempDir(self, max_age=None):
+        """Removing everything below TEMPPATH that is older than max_age seconds (default
+        "temp_max_age", 0 = all), subdirectories included. Returns {"files", "dirs", "bytes", ...}"""
+        return self.Cleaner.Run(max_age)
+
+    def StartPurge(self, max_age=None):
+        """PurgeTempDir() in a background thread, the report ends up in Cleaner.LAST"""
+        return self.Cleaner.Start(max_age)
+
+    def Untrack(self, filenames):
+        """Forgetting files that were removed from outside the registry (e.g. by the TempCleaner)"""
+        names = set(filenames) & self.FILES
+        if not names:
+            return
+        with self.lock:
+            self.FILES -= names
+        self.Forget(names)
+
+    #? Tracked Cleanup
+
+    def ManifestPath(self):
+        return f"{self.TEMPPATH}/{self.MANIFEST}"
+
+    def ReadManifest(self):
+        try:
+            with open(self.ManifestPath(), 'r', encoding='utf-8') as f:
+                return {line.rstrip("\n") for line in f if line.strip()}
+        except FileNotFoundError:
+            return set()
+
+    def ManifestState(self):
+        import os
+        try:
+            st = os.stat(self.ManifestPath())
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def LoadManifest(self):
+        """Taking over names other processes (or a crashed earlier run) listed in the manifest"""
+        state = self.ManifestState()
+        if state == self.manifest_state:
+            return
+        names = self.ReadManifest()
+        with self.lock:
+            self.FILES |= names - self.REMOVED
+            self.manifest_state = state
+
+    def Track(self, filename):
+        if filename in self.FILES:
+            return
+        with self.lock:
+            if filename in self.FILES:
+                return
+            self.FILES.add(filename)
+            self.REMOVED.discard(filename)
+        path = self.ManifestPath()
+        with FileLock(path):
+            AtomicFile.Append(path, filename + "\n")
+            self.manifest_state = self.ManifestState()
+
+    def Forget(self, names):
+        """Dropping names from the manifest (None: all of them)"""
+        import os
+        path = self.ManifestPath()
+        with FileLock(path):
+            remaining = [] if names is None else sorted(self.ReadManifest() - names)
+            if remaining:
+                AtomicFile.Write(path, "".join(f"{name}\n" for name in remaining))
+            else:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            self.manifest_state = self.ManifestState()
+
+    def Cleanup(self):
+        """Removing only the temp files that were created through TempAPI (see the manifest), returns
+        how many. Costs one stat of the manifest when nothing was created since the last cleanup."""
+        import os
+        self.LoadManifest()
+        if not self.FILES and not self.REMOVED and not self.SPOOLED:
+            return 0
+        with self.lock:
+            files, self.FILES = self.FILES, set()
+            forget, self.REMOVED = files | self.REMOVED, set()
+            removed = len(self.SPOOLED)
+            self.SPOOLED.clear()
+        for name in files:
+            try:
+                os.remove(f"{self.TEMPPATH}/{name}")
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # still in use (e.g. open on Windows), try again next time
+                with self.lock:
+                    self.FILES.add(name)
+                forget.discard(name)
+        self.Forget(forget)
+        return removed
+
+    def IsScheduled(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def StartCleanup(self, interval=30.0):
+        """Cleanup() every interval seconds in a background thread instead of on the interactive path"""
+        import threading
+        if self.IsScheduled():
+            return
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self._CleanupLoop, args=(interval,), name="TempCleanup", daemon=True)
+        self.thread.start()
+
+    def StopCleanup(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+        self.thread = None
+
+    def _CleanupLoop(self, interval):
+        while not self.stopping.wait(interval):
+            try:
+                self.Cleanup()
+                if self.Cleaner.MAX_AGE:
+                    self.Cleaner.Run()  # retention: whatever else outlived "temp_max_age"
+            except Exception:
+                pass
+
+    #? ################  TEMP CLEANER #####################
+
+class TempCleaner:
+    """Recursive cleanup of the temp directory: os.scandir depth-first, files before their directory,
+    symlinks are removed, never followed. Files and directories younger than max_age seconds are kept
+    (0 = remove everything), so are the manifest, the lock file and in-flight writes in TEMPPATH itself.
+    Run() blocks, Start() runs it in a background thread; both leave their report in LAST."""
+
+    def __init__(self, temp, max_age=0):
+        import threading
+        self.Temp = temp
+        self.MAX_AGE = max_age
+        self.LAST = None
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def Run(self, max_age=None):
+        import time
+        with self.lock:
+            started = time.perf_counter()
+            max_age = self.MAX_AGE if max_age is None else max_age
+            cutoff = time.time() - max_age if max_age else None
+            report = {"files": 0, "dirs": 0, "bytes": 0, "kept": 0, "errors": 0}
+            removed = []
+            self._Purge(self.Temp.TEMPPATH, cutoff, report, removed, top=True)
+            self.Temp.Untrack(removed)
+            report["seconds"] = round(time.perf_counter() - started, 4)
+            self.LAST = report
+            return report
+
+    def _Purge(self, directory, cutoff, report, removed, top=False):
+        """Returns True if directory is empty afterwards"""
+        import os
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError:
+            report["errors"] += 1
+            return False
+        empty = True
+        for entry in entries:
+            if top and (AtomicFile.IsInternal(entry.name) or entry.name == self.Temp.MANIFEST):
+                empty = False
+                continue
+            try:
+                st = entry.stat(follow_symlinks=False)
+                young = cutoff is not None and st.st_mtime >= cutoff
+                if entry.is_dir(follow_symlinks=False):
+                    if self._Purge(entry.path, cutoff, report, removed) and not young:
+                        os.rmdir(entry.path)
+                        report["dirs"] += 1
+                    else:
+                        empty = False
+                    continue
+                if young:
+                    report["kept"] += 1
+                    empty = False
+                    continue
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue  # removed by someone else meanwhile
+            except OSError:
+                report["errors"] += 1
+                empty = False
+                continue
+            report["files"] += 1
+            report["bytes"] += st.st_size
+            if top:
+                removed.append(entry.name)
+        return empty
+
+    def IsRunning(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def Start(self, max_age=None):
+        import threading
+        if self.IsRunning():
+            return self.thread
+        self.thread = threading.Thread(target=self.Run, args=(max_age,), name="TempCleaner", daemon=True)
+        self.thread.start()
+        return self.thread
+
+    #? ################  SPOOLED TEMP FILE #####################
+
+class SpooledTempFile:
+    """File-like handle of a temp entry (TempAPI.OpenTempFile). The text stays in memory up to the
+    spool size and moves to TEMPPATH/filename once it grows beyond, the handle then continues on
+    that file. Other TempAPI calls see what was written after flush() or close()."""
+
+    MODES = ("r", "r+", "w", "w+", "a", "a+")
+
+    def __init__(self, temp, filename, mode="w"):
+        import io
+        if mode not in self.MODES:
+            raise ValueError(f"Nicht unterstützter Modus: {mode}")
+        self.Temp = temp
+        self.NAME = filename
+        self.MODE = mode
+        self.file = None
+        self.closed = False
+        if mode.startswith("w") or (mode.startswith("a") and not temp.TempExists(filename)):
+            content = ""
+        else:
+            content = temp.ReadTempFile(filename)
+        self.buffer = io.StringIO(content)
+        self.size = len(content)
+        if mode.startswith("a"):
+            self.buffer.seek(0, 2)
+        if self.Writable() and (not temp.SPOOL_SIZE or self.size > temp.SPOOL_SIZE):
+            self.Spill()
+
+    def Writable(self):
+        return self.MODE != "r"
+
+    def IsSpilled(self):
+        return self.file is not None
+
+    def Spill(self):
+        """Moving the content to TEMPPATH/filename, further calls go to the real file"""
+        position = self.buffer.tell()
+        content = self.buffer.getvalue()
+        self.Temp.WriteDisk(self.NAME, content)
+        self.file = open(f"{self.Temp.TEMPPATH}/{self.NAME}", 'r+', encoding='utf-8')
+        if position == len(content):
+            self.file.seek(0, 2)
+        else:
+            self.file.read(position)  # text files only seek to opaque cookies
+        self.buffer = None
+
+    def write(self, text):
+        import io
+        if not self.Writable():
+            raise io.UnsupportedOperation("not writable")
+        if self.file is not None:
+            return self.file.write(text)
+        written = self.buffer.write(text)
+        self.size = max(self.size, self.buffer.tell())
+        if self.size > self.Temp.SPOOL_SIZE:
+            self.Spill()
+        return written
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def read(self, size=-1):
+        return (self.file or self.buffer).read(size)
+
+    def readline(self, size=-1):
+        return (self.file or self.buffer).readline(size)
+
+    def __iter__(self):
+        return iter(self.file or self.buffer)
+
+    def seek(self, offset, whence=0):
+        return (self.file or self.buffer).seek(offset, whence)
+
+    def tell(self):
+        return (self.file or self.buffer).tell()
+
+    def getvalue(self):
+        if self.file is None:
+            return self.buffer.getvalue()
+        self.file.flush()
+        return self.Temp.ReadTempFile(self.NAME)
+
+    def flush(self):
+        if self.file is not None:
+            self.file.flush()
+        elif self.Writable():
+            self.Temp.Spool(self.NAME, self.buffer.getvalue())
+
+    def close(self):
+        if self.closed:
+            return
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    #? ################  BINARY READER #####################
+
+class BinaryReader:
+    """Binary read helpers shared by CacheAPI and TempAPI"""
+
+    MMAP_THRESHOLD = 256 * 1024  # smaller files are cheaper to read() than to map
+
+    @staticmethod
+    def ReadBytes(path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    @classmethod
+    def View(cls, path):
+        import mmap
+        import os
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < cls.MMAP_THRESHOLD:
+                return memoryview(f.read())
+            # the view keeps the mapping alive, the file descriptor can be closed
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @staticmethod
+    def Map(path):
+        import mmap
+        import os
+        with open(path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return memoryview(b"")  # mmap cannot map an empty file, memoryview is a context manager as well
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def IterChunks(path, chunk_size=64 * 1024):
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        with open(path, 'rb', buffering=0) as f:
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                yield view[:n]
+
+    #? ################  FILE LOCKS #####################
+
+class FileLock:
+    """with FileLock(path): ... -> exclusive across processes and threads, for read-modify-write of
+    shared data files (e.g. the Terminal mod runs modules as subprocesses on the same dirs).
+    Data files are replaced by rename, so they are never locked themselves: each directory has one
+    ".lock" file, kept open for the process lifetime, and a path locks one byte of it (fcntl.lockf
+    at crc32(name)). Without fcntl (Windows) only the threads of this process are serialized.
+    on_enter is called once the lock is held (CacheAPI drops its in-memory copy there)."""
+
+    LOCKFILE = ".lock"
+    SLOTS = 1 << 20
+    DESCRIPTORS = {}  # directory -> fd of its lock file (closing any fd would drop all our locks on it)
+    ENTRIES = {}  # (directory, slot) -> [RLock, depth], fcntl locks are per process, not per thread
+
+    def __init__(self, path, on_enter=None):
+        import os
+        import threading
+        import zlib
+        self.ON_ENTER = on_enter
+        self.DIRECTORY, name = os.path.split(os.path.abspath(path))
+        self.SLOT = zlib.crc32(name.encode('utf-8')) % self.SLOTS
+        self.entry = self.ENTRIES.setdefault((self.DIRECTORY, self.SLOT), [threading.RLock(), 0])
+
+    @classmethod
+    def Descriptor(cls, directory):
+        fd = cls.DESCRIPTORS.get(directory)
+        if fd is None:
+            import os
+            import threading
+            with cls.ENTRIES.setdefault((directory, None), [threading.RLock(), 0])[0]:
+                fd = cls.DESCRIPTORS.get(directory)
+                if fd is None:
+                    os.makedirs(directory, exist_ok=True)
+                    fd = os.open(os.path.join(directory, cls.LOCKFILE), os.O_RDWR | os.O_CREAT, 0o666)
+                    cls.DESCRIPTORS[directory] = fd
+        return fd
+
+    def __enter__(self):
+        self.entry[0].acquire()
+        self.entry[1] += 1
+        if self.entry[1] == 1:
+            try:
+                import fcntl
+            except ImportError:
+                fcntl = None
+            try:
+                if fcntl is not None:
+                    fcntl.lockf(self.Descriptor(self.DIRECTORY), fcntl.LOCK_EX, 1, self.SLOT)
+            except BaseException:
+                self.entry[1] -= 1
+                self.entry[0].release()
+                raise
+        if self.ON_ENTER is not None:
+            try:
+                self.ON_ENTER()
+            except BaseException:
+                self.__exit__(None, None, None)
+                raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self.entry[1] == 1:
+                try:
+                    import fcntl
+                except ImportError:
+                    fcntl = None
+                if fcntl is not None:
+                    fcntl.lockf(self.Descriptor(self.DIRECTORY), fcntl.LOCK_UN, 1, self.SLOT)
+        finally:
+            self.entry[1] -= 1
+            self.entry[0].release()
+        return False
+
+
+class AtomicFile:
+    """Writes that concurrent processes cannot tear: full writes go to a temp file in the same
+    directory and are renamed over the target, appends are one write() on an O_APPEND descriptor."""
+
+    UMASK = 0o022  # replaced at import by ReadUmask(), see below the class
+
+    @staticmethod
+    def ReadUmask():
+        """The process umask without changing it (/proc/self/status). Elsewhere it can only be read
+        by setting it, which races with threads creating files, so this runs once at import."""
+        import os
+        try:
+            with open("/proc/self/status") as f:
+                for line in f:
+                    if line.startswith("Umask:"):
+                        return int(line.split()[1], 8)
+        except (OSError, ValueError):
+            pass
+        umask = os.umask(0)
+        os.umask(umask)
+        return umask
+
+    @classmethod
+    def Write(cls, path, content, durable=False, encoding='utf-8'):
+        """Readers see either the old or the new file, never a half-written one (str or bytes).
+        durable=False skips the fsyncs: still atomic for concurrent readers, not across power loss.
+        Returns the os.stat_result of the written file (rename keeps inode, size and mtime)."""
+        import os
+        import tempfile
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+        try:
+            binary = isinstance(content, (bytes, bytearray, memoryview))
+            with os.fdopen(fd, 'wb' if binary else 'w', encoding=None if binary else encoding) as f:
+                f.write(content)
+                f.flush()
+                if durable:
+                    os.fsync(f.fileno())
+                written = os.fstat(f.fileno())
+            try:
+                mode = os.stat(path).st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o666 & ~cls.UMASK  # what open(path, 'w') would have created, mkstemp uses 0600
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        if not durable:
+            return written
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return written
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+        return written
+
+    @staticmethod
+    def Append(path, text):
+        import os
+        data = text.encode('utf-8') if isinstance(text, str) else bytes(text)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            written = os.write(fd, data)
+            while written < len(data):  # short write (disk full, signal), nothing to keep atomic anymore
+                written += os.write(fd, data[written:])
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def IsInternal(name):
+        """Lock files and in-flight temp files of Write(), which cleanups must not delete"""
+        return name == FileLock.LOCKFILE or (name.startswith(".") and name.endswith(".tmp"))
+
+AtomicFile.UMASK = AtomicFile.ReadUmask()
 
     #? ################  PACKAGE API #####################
 
@@ -194,20 +2290,21 @@ class PackageAPI:
         self.USERNAME = None
         
     def WritePackageFile(self, filename, content):
-        with open(f"{self.PACKAGEPATH}/{filename}", 'w', encoding='utf-8') as f:
-            f.write(content)
+        AtomicFile.Write(f"{self.PACKAGEPATH}/{filename}", content, durable=True)
             
     def ReadPackageFile(self, filename):
         with open(f"{self.PACKAGEPATH}/{filename}", 'r', encoding='utf-8') as f:
             return f.read()
         
     def AddContent(self, filename, content):
-        with open(f"{self.PACKAGEPATH}/{filename}", 'a', encoding='utf-8') as f:
-            f.write(content + "\n")
+        AtomicFile.Append(f"{self.PACKAGEPATH}/{filename}", content + "\n")
     
     def RemovePackageFile(self, filename):
         import os
         os.remove(f"{self.PACKAGEPATH}/{filename}")
+
+    def Lock(self, filename):
+        return FileLock(f"{self.PACKAGEPATH}/{filename}")
         
     #? ################  LOG API #####################
         
@@ -222,8 +2319,7 @@ class LogAPI:
     def WriteLog(self, filename, message):
         import datetime
         timestamp = datetime.datetime.now().isoformat()
-        with open(f"{self.LOGPATH}/{filename}", 'a', encoding='utf-8') as f:
-            f.write(f"[{timestamp}] {message}\n")
+        AtomicFile.Append(f"{self.LOGPATH}/{filename}", f"[{timestamp}] {message}\n")
             
     def ReadLog(self, filename):
         with open(f"{self.LOGPATH}/{filename}", 'r', encoding='utf-8') as f:
@@ -234,8 +2330,7 @@ class LogAPI:
         os.remove(f"{self.LOGPATH}/{filename}")
         
     def ClearLog(self, filename):
-        with open(f"{self.LOGPATH}/{filename}", 'w') as f:
-            f.write("")
+        AtomicFile.Write(f"{self.LOGPATH}/{filename}", "")
                
     def LogExists(self, filename=None):
         import os
@@ -292,28 +2387,121 @@ class CommandAPI:
 
 class LanguageAPI:
 
-    def __init__(self, settings, standard_library=True):
+    def __init__(self, settings, standard_library=True, shared=True):
         self.Settings = settings
+        self.BASE = SharedContext.CATALOGS if shared else {}  # (languagepath, language) -> unmerged catalog, read-only
+        self.USERS = SharedContext.CATALOG_USERS if shared else {}  # base entries are dropped with their last user
+        self.RETAINED = {}  # language -> base key this instance holds in USERS
         self.LANGUAGE = settings.LANGUAGE
         self.LANGUAGEPATH = settings.LANGUAGEPATH
         self.PACKAGES = []
+        self.Catalog = CatalogCache(settings.CACHEPATH)
+        from collections import OrderedDict
+        import threading
+        self.CATALOGS = OrderedDict()  # language -> resident catalog with packages merged in (LRU)
+        self.TEMPLATES = {}  # language -> {key: compiled Format() template}
+        from collections import Counter
+        self.FALLBACKS = Counter()  # language -> loads that fell back to de.json (load time only, always counted)
+        self.STATS = None  # hit/miss counters, only allocated while EnableStats() is active
+        self.lock = threading.RLock()
+        self.MAX_LANGUAGES = max(1, getattr(settings, "LANGUAGE_CACHE_SIZE", 8))
+        self.COMPACT = getattr(settings, "COMPACT_CATALOGS", False)  # one shared key table + value tuples
         if standard_library:
             import os
             package_dir = os.path.dirname(os.path.abspath(__file__))
             self.LANGUAGEPATH = os.path.join(package_dir, "data", "lang")
-        self.language_data = self.LoadLanguageData(self.LANGUAGE)
+        self.Activate(self.LANGUAGE, self.GetCatalog(self.LANGUAGE))
         
     #? Core Functions
 
     # Reloading language data (e.g. after changing language in settings or adding new language-packs)
-    def Reload(self):
-        """Reloading Language-Data and applied Language-Packages"""
+    def Reload(self, force=False):
+        """Switching to Settings.LANGUAGE. Resident languages are a pointer swap, force=True re-reads from disk"""
+        if force:
+            self.Invalidate()
         self.LANGUAGE = self.Settings.LANGUAGE
-        self.language_data = self.LoadLanguageData(self.LANGUAGE)
-        if self.PACKAGES:
-            for package in self.PACKAGES:
-                if package["language"] == self.LANGUAGE:
-                    self.language_data.update(package["data"])
+        self.Activate(self.LANGUAGE, self.GetCatalog(self.LANGUAGE))
+
+    def Activate(self, language, catalog):
+        self.templates = self.TEMPLATES.setdefault(language, {})
+        self.language_data = catalog
+
+    def GetCatalog(self, language):
+        """Returning the merged catalog of language, loading it once and keeping it resident (LRU)"""
+        with self.lock:
+            catalog = self.CATALOGS.get(language)
+            if catalog is not None:
+                self.CATALOGS.move_to_end(language)
+                return catalog
+            base_key = (self.LANGUAGEPATH, language)
+            catalog = self.BASE.get(base_key)
+            if catalog is None:
+                catalog = self.LoadLanguageData(language)
+                if self.COMPACT:
+                    catalog = CompactCatalog(catalog)
+            with SharedContext.Lock("catalogs"):
+                catalog = self.BASE.setdefault(base_key, catalog)
+                self.USERS[base_key] = self.USERS.get(base_key, 0) + 1
+            self.RETAINED[language] = base_key
+            packages = [package for package in self.PACKAGES if package["language"] == language]
+            if packages:
+                catalog = dict(catalog)  # copy-on-write, the base catalog may be shared with other instances
+                for package in packages:
+                    catalog.update(self.LoadPackage(package))
+                if self.COMPACT:
+                    catalog = CompactCatalog(catalog)
+            self.CATALOGS[language] = catalog
+            while len(self.CATALOGS) > self.MAX_LANGUAGES:
+                evicted, _ = self.CATALOGS.popitem(last=False)
+                self.TEMPLATES.pop(evicted, None)
+                self.Release(evicted)
+            return catalog
+
+    def Release(self, language):
+        """Giving up this instance's use of the shared base catalog, the last user drops it"""
+        base_key = self.RETAINED.pop(language, None)
+        if base_key is None:
+            return
+        with SharedContext.Lock("catalogs"):
+            users = self.USERS.get(base_key, 0) - 1
+            if users > 0:
+                self.USERS[base_key] = users
+            else:
+                self.USERS.pop(base_key, None)
+                self.BASE.pop(base_key, None)
+
+    def Prefetch(self, language):
+        """Building the catalog of a likely next language in a background thread"""
+        import threading
+        with self.lock:
+            if language in self.CATALOGS:
+                return None
+        thread = threading.Thread(target=self.GetCatalog, args=(language,), name=f"LanguagePrefetch-{language}", daemon=True)
+        thread.start()
+        return thread
+
+    def Preload(self, languages=None):
+        """Warming up the resident catalogs (default: all available languages, bounded by the LRU size)"""
+        for language in languages or self.GetAvailableLanguages():
+            self.GetCatalog(language)
+        if self.LANGUAGE in self.CATALOGS:
+            self.CATALOGS.move_to_end(self.LANGUAGE)
+
+    def Invalidate(self, language=None):
+        """Dropping resident catalogs so they are rebuilt on next use"""
+        with self.lock:
+            if language is None:
+                self.CATALOGS.clear()
+                self.TEMPLATES.clear()
+                for retained in list(self.RETAINED):
+                    self.Release(retained)
+                with SharedContext.Lock("catalogs"):
+                    for key in [key for key in self.BASE if key[0] == self.LANGUAGEPATH]:
+                        self.BASE.pop(key, None)
+            else:
+                self.CATALOGS.pop(language, None)
+                self.TEMPLATES.pop(language, None)
+                self.Release(language)
 
     def SetLanguageData(self, keys: dict=None, prefered_lang_reference=False):
         if prefered_lang_reference:
@@ -321,21 +2509,22 @@ class LanguageAPI:
             import os
             package_dir = os.path.dirname(os.path.abspath(__file__))
             self.LANGUAGEPATH = os.path.join(package_dir, "data", "lang")
-            self.language_data = self.LoadLanguageData(self.LANGUAGE)
+            self.Invalidate()
+            self.Activate(self.LANGUAGE, self.GetCatalog(self.LANGUAGE))
         elif keys:
-            self.language_data = keys
+            self.Invalidate(self.LANGUAGE)
+            self.CATALOGS[self.LANGUAGE] = keys
+            self.Activate(self.LANGUAGE, keys)
     
     # Loading Original Language-Data json formats from /assets/manager/lang/{'de', 'en', 'ru',..}.json    
     def LoadLanguageData(self, language):
-        """Loading Language-Data by parameter: language"""
-        import json
+        """Loading Language-Data by parameter: language (served from the compiled catalog cache)"""
         try:
-            with open(f"{self.LANGUAGEPATH}/{language}.json", 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return self.Catalog.Load(f"{self.LANGUAGEPATH}/{language}.json")
         except FileNotFoundError:
+            self.FALLBACKS[language] += 1
             try:
-                with open(f"{self.LANGUAGEPATH}/de.json", 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return self.Catalog.Load(f"{self.LANGUAGEPATH}/de.json")
             except FileNotFoundError:
                 return {}
 
@@ -344,6 +2533,106 @@ class LanguageAPI:
     def Translate(self, key):
         """Translating Keyword by key with current language-data"""
         return self.language_data.get(key, key)
+
+    def TranslateMany(self, keys):
+        """Translating several keys in one call, returns a tuple in the same order"""
+        get = self.language_data.get
+        return tuple(map(get, keys, keys))
+
+    def Format(self, key, **params):
+        """Translating key and filling its {placeholders}. Templates are compiled once per catalog."""
+        render = self.templates.get(key)
+        if render is None:
+            render = self.templates[key] = self.CompileTemplate(self.language_data.get(key, key))
+        try:
+            return render(**params)
+        except (KeyError, IndexError, TypeError, ValueError, AttributeError):
+            return self.language_data.get(key, key)
+
+    #? Statistics
+
+    def EnableStats(self):
+        """Counting hits per key and misses per language. Disabled, Translate stays a plain dict.get."""
+        from collections import Counter
+        if self.STATS is None:
+            self.STATS = {"hits": Counter(), "misses": Counter(), "missing": {}}
+        self.Translate = self.CountingTranslate
+        self.TranslateMany = self.CountingTranslateMany
+
+    def DisableStats(self):
+        self.__dict__.pop("Translate", None)
+        self.__dict__.pop("TranslateMany", None)
+
+    def ResetStats(self):
+        self.FALLBACKS.clear()
+        if self.STATS is not None:
+            self.STATS["hits"].clear()
+            self.STATS["misses"].clear()
+            self.STATS["missing"].clear()
+
+    def GetStats(self, top=None):
+        """Returning a snapshot: hits per key, misses per language, missing keys, de.json fallbacks"""
+        stats = self.STATS or {"hits": {}, "misses": {}, "missing": {}}
+        hits = stats["hits"]
+        return {
+            "enabled": "Translate" in self.__dict__,
+            "hits": dict(hits.most_common(top)) if top else dict(hits),
+            "misses": dict(stats["misses"]),
+            "missing": {language: dict(keys) for language, keys in stats["missing"].items()},
+            "fallbacks": dict(self.FALLBACKS),
+        }
+
+    def ExportStats(self, path, top=None):
+        """Writing GetStats() as json (atomic)"""
+        import json
+        AtomicFile.Write(path, json.dumps(self.GetStats(top), ensure_ascii=False, indent=4), durable=True)
+
+    def CountingTranslate(self, key):
+        data = self.language_data
+        if key in data:
+            self.STATS["hits"][key] += 1
+            return data[key]
+        self.CountMiss(key)
+        return key
+
+    def CountingTranslateMany(self, keys):
+        return tuple(map(self.CountingTranslate, keys))
+
+    def CountMiss(self, key):
+        from collections import Counter
+        self.STATS["misses"][self.LANGUAGE] += 1
+        missing = self.STATS["missing"].get(self.LANGUAGE)
+        if missing is None:
+            missing = self.STATS["missing"][self.LANGUAGE] = Counter()
+        missing[key] += 1
+
+    @staticmethod
+    def CompileTemplate(text):
+        """Turning "Hello {name}" into a function rendering an f-string, so placeholders are parsed only once"""
+        import keyword
+        import string
+        try:
+            parts = list(string.Formatter().parse(text))
+        except ValueError:
+            return lambda **params: text
+        fields = [field for _, field, _, _ in parts if field is not None]
+        if not fields:
+            plain = "".join(literal for literal, _, _, _ in parts)
+            return lambda **params: plain
+        source = []
+        for literal, field, spec, conversion in parts:
+            source.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is None:
+                continue
+            if not field.isidentifier() or keyword.iskeyword(field) or any(c in spec for c in "{}'\"\\\n"):
+                # indexed/attribute/nested fields: let str.format handle them
+                return lambda **params: text.format_map(params)
+            source.append("{" + field + (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "") + "}")
+        arguments = ", ".join(dict.fromkeys(fields))
+        try:
+            return eval(f"lambda {arguments}, **_: f{''.join(source)!r}", {})
+        except SyntaxError:
+            return lambda **params: text.format_map(params)
     
     def GetAllTranslationKeys(self):
         """Returning all translation keys"""
@@ -356,13 +2645,207 @@ class LanguageAPI:
         languages = [f.split('.')[0] for f in files if f.endswith('.json')]
         return languages
     
-    def AddLanguagePackage(self, language, datapath):
-        import json
-        with open(datapath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        self.PACKAGES.append({"language": language, "data": data})
+    def AddLanguagePackage(self, language, datapath, lazy=True):
+        """Registering a package. Lazy packages are only read when their language becomes active."""
+        package = {"language": language, "path": datapath, "data": None}
+        if not lazy:
+            self.LoadPackage(package)
+        self.PACKAGES.append(package)
+        self.Invalidate(language)  # re-merged on the next Reload()
+
+    def LoadPackage(self, package):
+        if package["data"] is None:
+            package["data"] = self.Catalog.Load(package["path"])
+        return package["data"]
         
         
+    #? ################  COMPACT CATALOG #################
+
+class CompactCatalog:
+    """Read-only catalog for many resident languages: the keys live once in a shared (interned)
+    key -> index table, every language only stores a tuple of values. get() stays O(1).
+    """
+
+    KEYS = {}  # process-wide key table shared by all compact catalogs
+    MISSING = object()
+
+    __slots__ = ("INDEX", "VALUES", "LENGTH", "lookup")
+
+    def __init__(self, data, keys=None):
+        import sys
+        index = self.KEYS if keys is None else keys
+        # several LanguageAPI instances and prefetch threads add to the shared table: indices must stay unique
+        with SharedContext.Lock("compact-keys"):
+            for key in data:
+                if key not in index:
+                    index[sys.intern(key)] = len(index)
+            values = [self.MISSING] * len(index)
+            for key, value in data.items():
+                values[index[key]] = value
+        self.INDEX = index
+        self.VALUES = tuple(values)
+        self.LENGTH = len(data)
+        self.lookup = index.get  # bound once, saves the attribute lookups on the Translate path
+
+    def get(self, key, default=None):
+        i = self.lookup(key)
+        if i is None:
+            return default
+        try:
+            value = self.VALUES[i]
+        except IndexError:
+            return default  # key added to the shared table after this catalog was built
+        return default if value is self.MISSING else value
+
+    def __getitem__(self, key):
+        value = self.get(key, self.MISSING)
+        if value is self.MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, self.MISSING) is not self.MISSING
+
+    def __len__(self):
+        return self.LENGTH
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        values = self.VALUES
+        return [key for key, i in self.INDEX.items() if i < len(values) and values[i] is not self.MISSING]
+
+    def items(self):
+        return [(key, self.VALUES[i]) for key, i in self.INDEX.items() if i < len(self.VALUES) and self.VALUES[i] is not self.MISSING]
+
+    #? ################  CATALOG CACHE #################
+
+class CatalogCache:
+    """Compiled (marshal) copies of language json files under {cachepath}/lang.
+
+    A blob is keyed by source path + mtime + size and rebuilt automatically when the json changes.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, cache_path=None):
+        import os
+        self.CACHEPATH = os.path.join(cache_path, "lang") if cache_path else None
+
+    def BlobPath(self, source_path):
+        import hashlib
+        import os
+        digest = hashlib.sha1(os.fsencode(source_path)).hexdigest()[:16]
+        name = os.path.splitext(os.path.basename(source_path))[0]
+        return os.path.join(self.CACHEPATH, f"{name}-{digest}.catalog")
+
+    def Load(self, source_path):
+        """Returns a fresh dict for source_path. Raises FileNotFoundError like open()."""
+        import os
+        source_path = os.path.abspath(source_path)
+        st = os.stat(source_path)
+        key = (self.FORMAT, source_path, st.st_mtime_ns, st.st_size)
+        if self.CACHEPATH is None:
+            return self.Parse(source_path)
+        blob_path = self.BlobPath(source_path)
+        data = self.ReadBlob(blob_path, key)
+        if data is None:
+            data = self.Parse(source_path)
+            self.WriteBlob(blob_path, key, data)
+        return data
+
+    def Parse(self, source_path):
+        import json
+        with open(source_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def ReadBlob(self, blob_path, key):
+        import marshal
+        try:
+            with open(blob_path, 'rb') as f:
+                blob_key, data = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return data if blob_key == key else None
+
+    def WriteBlob(self, blob_path, key, data):
+        import marshal
+        import os
+        try:
+            os.makedirs(self.CACHEPATH, exist_ok=True)
+            AtomicFile.Write(blob_path, marshal.dumps((key, data)), durable=True)
+        except (OSError, ValueError):
+            pass  # the cache is an optimisation only
+
+    def Clear(self):
+        import os
+        if self.CACHEPATH and os.path.isdir(self.CACHEPATH):
+            for entry in os.scandir(self.CACHEPATH):
+                if entry.name.endswith(".catalog"):
+                    os.remove(entry.path)
+
+
+    #? ################  SHARED CONTEXT #################
+
+class SharedContext:
+    """Process-wide registry, so further Api/ToolAPI instances (e.g. mods) reuse what is already loaded:
+    settings dict + snapshot per settings file, base language catalogs and Cache/Temp/Log handles.
+    Shared objects are treated as read-only, instances copy them before changing anything.
+    """
+
+    CONTEXTS = {}  # abs settings path -> {"path", "settings", "snapshot"}
+    DEFAULT = None  # first registered settings path, used when an instance passes no settings_path
+    CATALOGS = {}  # (languagepath, language) -> base catalog
+    CATALOG_USERS = {}  # (languagepath, language) -> LanguageAPI instances holding it resident
+    HANDLES = {}  # (class name, abs path) -> storage api instance
+    LOCKS = {}  # name -> process-wide RLock
+
+    @classmethod
+    def Lock(cls, name):
+        """Process-wide lock by name (setdefault is atomic, so no lock is needed to create one)"""
+        import threading
+        lock = cls.LOCKS.get(name)
+        if lock is None:
+            lock = cls.LOCKS.setdefault(name, threading.RLock())
+        return lock
+
+    @classmethod
+    def Get(cls, settings_path=None):
+        import os
+        if settings_path is None:
+            settings_path = cls.DEFAULT
+            if settings_path is None:
+                return None
+        return cls.CONTEXTS.get(os.path.abspath(settings_path))
+
+    @classmethod
+    def Register(cls, settings_path, settings, snapshot):
+        import os
+        path = os.path.abspath(settings_path)
+        cls.CONTEXTS[path] = {"path": settings_path, "settings": settings, "snapshot": snapshot}
+        if cls.DEFAULT is None:
+            cls.DEFAULT = path
+
+    @classmethod
+    def Handle(cls, api_class, path, shared=True, *args):
+        """Returning the shared api_class(path, *args) instance (directories are checked/created only once)"""
+        import os
+        if not shared or path is None:
+            return api_class(path, *args)
+        key = (api_class.__name__, os.path.abspath(path))
+        handle = cls.HANDLES.get(key)
+        if handle is None:
+            handle = cls.HANDLES.setdefault(key, api_class(path, *args))
+        return handle
+
+    @classmethod
+    def Reset(cls):
+        cls.CONTEXTS.clear()
+        cls.CATALOGS.clear()
+        cls.CATALOG_USERS.clear()
+        cls.HANDLES.clear()
+        cls.DEFAULT = None
 
     #? ################  TOOL API #####################
 
@@ -373,14 +2856,16 @@ class ToolAPI:
         self.SDK = SDK(**sdk)
         self.Settings = SettingsAPI(self)
         if self.CheckCompatibility(self.Settings.VERSION, self.SDK.SDK_VERSION):
-            self.Cache = CacheAPI(self.Settings.CACHEPATH)
-            self.Temp = TempAPI(self.Settings.TEMPPATH)
+            self.Cache = SharedContext.Handle(CacheAPI, self.Settings.CACHEPATH, self.SDK.SDK_Shared, self.Settings)
+            self.Temp = SharedContext.Handle(TempAPI, self.Settings.TEMPPATH, self.SDK.SDK_Shared, self.Settings)
             self.Package = PackageAPI(self.Settings.PACKAGEPATH)
-            self.Log = LogAPI(self.Settings.LOGPATH)
+            self.Log = SharedContext.Handle(LogAPI, self.Settings.LOGPATH, self.SDK.SDK_Shared)
             self.manager = ManagerAPI()
             self.helper = HelperAPI(self)
-            self.language = LanguageAPI(self.Settings, standard_library=self.SDK.SDK_LangLib)
+            self.language = LanguageAPI(self.Settings, standard_library=self.SDK.SDK_LangLib, shared=self.SDK.SDK_Shared)
             self.state_machine = StateMachineAPI()
+            if self.Settings.CACHE_STATS_INTERVAL:
+                self.Cache.StartStatsLog(self.Log, self.Settings.CACHE_STATS_INTERVAL)
 
     def CheckCompatibility(self, api_version, sdk_version: str):
         major, minor, patch = sdk_version.split(".")
@@ -395,14 +2880,16 @@ class Api:
         """ToolAPI's API-SDK. made for general use."""
         self.SDK = SDK(**sdk)
         self.Settings = SettingsAPI(self)
-        self.Cache = CacheAPI(self.Settings.CACHEPATH)
-        self.Temp = TempAPI(self.Settings.TEMPPATH)
+        self.Cache = SharedContext.Handle(CacheAPI, self.Settings.CACHEPATH, self.SDK.SDK_Shared, self.Settings)
+        self.Temp = SharedContext.Handle(TempAPI, self.Settings.TEMPPATH, self.SDK.SDK_Shared, self.Settings)
         self.Package = PackageAPI(self.Settings.PACKAGEPATH)
-        self.Log = LogAPI(self.Settings.LOGPATH)
+        self.Log = SharedContext.Handle(LogAPI, self.Settings.LOGPATH, self.SDK.SDK_Shared)
         self.Manager = ManagerAPI()
         self.Helper = HelperAPI(self)
-        self.Language = LanguageAPI(self.Settings, standard_library=self.SDK.SDK_LangLib)
+        self.Language = LanguageAPI(self.Settings, standard_library=self.SDK.SDK_LangLib, shared=self.SDK.SDK_Shared)
         self.StateMachine = StateMachineAPI()
+        if self.Settings.CACHE_STATS_INTERVAL:
+            self.Cache.StartStatsLog(self.Log, self.Settings.CACHE_STATS_INTERVAL)
         
         
 class SDK:
@@ -414,3 +2901,4 @@ class SDK:
         self.SDK_SETTINGS = sdk.get("settings_path")
         self.SDK_NAME = sdk.get("name")
         self.SDK_LangLib = sdk.get("standard_language_library")
+        self.SDK_Shared = sdk.get("shared_context", True)  # reuse settings/catalogs/storage of earlier instances